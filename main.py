@@ -1,534 +1,3366 @@
-import tkinter as tk
-import random
-import os
-import json
-
-class Main:
-    '''Main class used to connect the other objects'''
-    def __init__(self):
-        '''Creates the other objects'''
-        self.Level_Folder_Path = os.getcwd() + r"\Level_Folder\ "[:-1]
-
-        self.Win = Root(self)
-        self.Level = LevelOperator(self)
-
-        self.Win.SetMenu()
-
-        self.Win.mainloop()
-
-    @property
-    def Level_Files_List(self) -> list:
-        '''Method binded with the Property decorator to be called like an attribut,
-        returning the list of the names of the json files stored in the folder Level_Folder'''
-
-        return sorted([file[:-5] for file in os.listdir(self.Level_Folder_Path) if file.endswith(".json")])
-
-
-    def CallMenu(self):
-        '''Prepares the game to open the menu by destroying the widget buttons from levels,
-        cleaning the labels and canvas, and unbinding the keyboard before openning the Menu screen'''
-        self.Win.Menu_Button.destroy()
-        self.Win.Recur_Button.destroy()
-        self.Win.ReselLabels()
-        self.Win.Canvas.delete('Level_Object')
-        self.Win.unbind('<Key>')
-        self.Win.SetMenu()
-
-    def CallLevel(self, level_name):
-        '''Setup the level called by calling the Win method displaying it,
-        creating and reseting the needed attributs and binding the keyboard
-        to detect key presses'''
-        self.Win.SetLevel(level_name)
-        self.current_level = level_name
-        self.Pile = []
-        self.Win.bind('<Key>', self.KeyPress)
-
-
-    def KeyPress(self, event):
-        '''Method binded to the entire keyboard during a level and reacting to
-        the arrows as player path input, storing them,
-        the backspace to delete inputs,
-        and Enter (Return) key to start the level'''
-        key_pressed = event.keysym
-        if key_pressed == 'Return'\
-        and len(self.Pile) > 0:
-            self.Win.Menu_Button.destroy()
-            self.Win.Recur_Button.destroy()
-            self.Win.unbind('<Key>')
-            self.Level.RunLevel(self.current_level)
-            return
-
-        elif key_pressed == 'BackSpace'\
-        and len(self.Pile) > 0:
-            self.Pile.pop()
-
-        elif key_pressed in ('Up','Down','Left','Right')\
-        and len(self.Pile) < 15:
-            self.Pile.append(key_pressed)
-
-        self.Win.UpdateInputLabels()
-
-
-    def Victory(self):
-        '''Called when victory occurs, calling the victory animation then calling the Menu'''
-        self.Win.Canvas.VictoryAnimation()
-        self.CallMenu()
-
-    def ResetLevel(self):
-        '''Called when a lose occurs, calling the death animation then reseting the level before calling it back'''
-        self.Win.Canvas.DeathAnimation()
-        self.Win.UpdateMemoryLabel()
-        self.CallLevel(self.current_level)
-
-
-    def StartAutoSolve(self):
-        '''Binded with the AutoSolve Button, it extracts the level data from its json file,
-        calls the recursive AutoSolve method then sends the results to the method displaying them'''
-        with open(self.Level_Folder_Path + self.current_level +'.json', 'r') as f:
-            lv_data = json.load(f)
-
-        player_coo = lv_data['Player_Starter_Coo']
-        self.victory_cell_coo = lv_data['Victory_Cell_Move']
-        self.red_cells = lv_data['Red_Cells_Move']
-
-        self.Visited_Boxes = [[] for i in range(15)]
-
-        path : str = self.AutoSolveRecur(player_coo, '0,0', -1)
-        self.Win.DisplayAutoSolve(path)
-
-    def AutoSolveRecur(self, prev_pos, move, step):
-        '''Recursive method simulating every player movement possible with a random priority order to create varying results,
-        storing them to prevent multiple paths leading to the same box in the same amount of moves, effectively saving ressources.
-        Returns its move upon reaching the Victory Cell and 'Fail' upon meeting one of the lose conditions
-        A move is a string composed of two values separated by a comma to be split.
-        The path is a string composed of an moves separated by a semicolon to be split during the path displaying'''
-
-        # Update Player Coo
-        curr_pos = [prev_pos[0]+int(move.split(',')[0]), prev_pos[1]+int(move.split(',')[1])]
-
-        # Victory Check
-        if curr_pos == self.victory_cell_coo[step-1] or curr_pos == self.victory_cell_coo[step]:
-            return move
-
-        # Death Check : Out of moves, Out of Bounds, Encountered Red Cell
-        if self.RecurDeathCheck(curr_pos, step):
-            return 'Fail'
-
-        # Else add current_position to Visited_Boxes to prevent creating
-        # multiple similar path
-        self.Visited_Boxes[step].append(curr_pos)
-
-        # Define available moves
-        move_list = ['0,75', '0,-75', '75,0', '-75,0']
-
-        # Simulate player moving in all 4 directions in a random order
-        # Return 'Fail' if every children failed, else return children
-        # path plus its own
-        Recur1 = self.AutoSolveRecur(curr_pos, move_list.pop(random.randint(0,3)), step+1)
-        if Recur1 != 'Fail':
-            return move+';'+Recur1
-
-        Recur2 = self.AutoSolveRecur(curr_pos, move_list.pop(random.randint(0,2)), step+1)
-        if Recur2 != 'Fail':
-            return move+';'+Recur2
-
-        Recur3 = self.AutoSolveRecur(curr_pos, move_list.pop(random.randint(0,1)), step+1)
-        if Recur3 != 'Fail':
-            return move+';'+Recur3
-
-        Recur4 = self.AutoSolveRecur(curr_pos, move_list[0], step+1)
-        if Recur4 != 'Fail':
-            return move+';'+Recur4
-
-        return 'Fail'
-
-    def RecurDeathCheck(self, curr_pos, step) -> bool:
-        '''Separated from AutoSolveRecur, checks player death conditions'''
-        return step >= 14\
-        or curr_pos[0] < 0\
-        or curr_pos[0] >= 750\
-        or curr_pos[1] < 0\
-        or curr_pos[1] >= 375\
-        or [True for red_cell in self.red_cells if curr_pos == red_cell[step-1] or curr_pos == red_cell[step]]\
-        or curr_pos in self.Visited_Boxes[step]
-
-################################################################################
-
-class Root(tk.Tk):
-    '''Root class, inhereted from the Tk window class in charge of the widgets'''
-    def __init__(self, main):
-        '''Creates the root object method 'tksleep',
-        Stores the address of Main,
-        Creates the Labels, storing their adresses in lists'''
-        super().__init__()
-
-        # Creating a root method to add delay,
-        # called like sleep() for time module
-        # but without freezing the window
-        # it was entirely found on Stack Overflow
-        ### From Stack Overflow ###
-        def tksleep(self, time:float) -> None:
-            self.after(int(time*1000), self.quit)
-            self.mainloop()
-        tk.Misc.tksleep = tksleep
-        ###########################
-
-        self.Main = main
-        self.Canvas = Canvas(self.Main, self)
-
-        self.title("OverMove")
-        self.geometry("%dx%d" % (800,600)) # window size
-        self.resizable(0,0)
-
-        self.CharacterConversion = {
-            'Up'    : '⮝', '0,-75' : '⮝',
-            'Down'  : '⮟', '0,75'  : '⮟',
-            'Left'  : '⮜', '-75,0' : '⮜',
-            'Right' : '⮞', '75,0'  : '⮞'}
-        ### Labels Creation ###
-        # invisible Label to pad the other widgets
-        tk.Label(self, width = 0).grid(row=0, column=0, padx = 4)
-
-        # Location Text Label
-        tk.Label(self, width = 1, height = 3, pady = 7, bg='white', borderwidth=3, relief="solid").grid(row=0, column=1, columnspan=10, sticky='ew', pady = 5)
-        self.location = tk.StringVar()
-        tk.Label(self, textvariable = self.location, width = 1, height = 1, font=('Arial', 20), bg='white', pady = 7, anchor="w", justify="left").grid(row=0, column=2, columnspan=3, sticky='ew', pady = 5)
-
-        # Creating the textvars for the Input labels
-        self.Input_Label_Textvariable_List = [tk.StringVar() for _ in range(15)]
-        # Creating the Input Labels
-        self.Input_Label_List = [
-            tk.Label(self, textvariable = Textvar, width = 1, height = 1, bg="white", borderwidth=3, relief="solid", font=('Arial', 25), pady = 4)
-            for Textvar in self.Input_Label_Textvariable_List
-            ]
-        # Placing the Input labels on the grid
-        i = 0
-        for label in self.Input_Label_List:
-            label.grid(row=2, column=i+1, sticky='ew', pady = 5)
-            i += 1
-
-        # Creating the textvars for the Memory labels
-        self.Memory_Label_Textvariable_List = [tk.StringVar() for _ in range(15)]
-        # Creating the Memory labels
-        self.Memory_Label_List = [
-            tk.Label(self, textvariable = Textvar, width = 1, height = 1, bg="white", borderwidth=3, relief="solid", font=('Arial', 25), pady = 4)
-            for Textvar in self.Memory_Label_Textvariable_List
-            ]
-        # Placing the Memory labels on the grid
-        i = 0
-        for label in self.Memory_Label_List:
-            label.grid(row=1, column=i+1, sticky='ew', pady = 5)
-            i += 1
-
-    def MenuClick(self, event):
-        '''Calls the level stored in the tags of the last Canvas object clicked'''
-        element_tags = self.Canvas.gettags("current")
-
-        if len(element_tags) == 0:
-            return
-
-        self.Main.CallLevel(element_tags[0])
-
-
-    def SetMenu(self):
-        '''Displays the menu screen'''
-        self.location.set("Menu")
-
-        self.Canvas.SetMenu(self.Main.Level_Files_List)
-
-        self.bind('<Button-1>', self.MenuClick)
-
-
-    def SetLevel(self, level):
-        '''Displays the level called'''
-        self.location.set(level)
-
-        self.unbind('<Button-1>')
-
-        self.Recur_Button = tk.Button(self, text ='Auto Solve', font=('Arial', 18), bg='white', pady = 9, relief=tk.SOLID, borderwidth=3, command = self.Main.StartAutoSolve)
-        self.Recur_Button.grid(row=0, column=13, columnspan=3, sticky='ew')
-
-        self.Menu_Button = tk.Button(self, text ='Menu', font=('Arial', 18), bg='white', pady = 9, relief=tk.SOLID, borderwidth=3, command = self.Main.CallMenu)
-        self.Menu_Button.grid(row=0, column=11, columnspan=2, sticky='ew')
-
-        self.Canvas.SetLevel(level)
-
-    def UpdateInputLabels(self):
-        '''Updates every Input Label. Called after player input'''
-        for i in range(len(self.Input_Label_Textvariable_List)):
-            if i < len(self.Main.Pile):
-                self.Input_Label_Textvariable_List[i].set(self.CharacterConversion[self.Main.Pile[i]])
-
-            else:
-                self.Input_Label_Textvariable_List[i].set('')
-
-    def PlayerUpdate(self):
-        '''Changes the background of the label containing the current player move played,
-        Calls Canvas to update player cell'''
-        self.Input_Label_List[self.Main.Level.step-1].config(bg="white")
-        self.Input_Label_List[self.Main.Level.step].config(bg="cornflower blue")
-        self.Canvas.CanPlayerUpdate()
-
-    def CellUpdate(self):
-        '''Calls Canvas to update the victory and red cells'''
-        self.Canvas.CanCellUpdate()
-
-    def UpdateMemoryLabel(self):
-        '''Called when reseting a level
-        Stores the moves from the Input Labels to the Memory Labels before reseting the Input Labels
-        Colors the background of the Memory Label containing the last instruction played'''
-        for i in range(15):
-            self.Input_Label_List[i].config(bg="white")
-            self.Memory_Label_List[i].config(bg="white")
-            self.Memory_Label_Textvariable_List[i].set(self.Input_Label_Textvariable_List[i].get())
-            self.Input_Label_Textvariable_List[i].set('')
-
-        self.Memory_Label_List[self.Main.Level.step-1].config(bg="firebrick1")
-
-    def ReselLabels(self):
-        '''Resets the colour and text of the Input and Memory Labels'''
-        for i in range(15):
-            self.Input_Label_List[i].config(bg="white")
-            self.Memory_Label_List[i].config(bg="white")
-            self.Input_Label_Textvariable_List[i].set('')
-            self.Memory_Label_Textvariable_List[i].set('')
-
-    def DisplayAutoSolve(self, path):
-        '''Display results of AutoSolve in memory label'''
-
-        path = path.split(';')[1:]
-
-        for i in range(15):
-            self.Memory_Label_List[i].config(bg="white")
-            self.Memory_Label_Textvariable_List[i].set('')
-
-        i = 0
-        for move in path:
-            self.Memory_Label_Textvariable_List[i].set(self.CharacterConversion[move])
-
-            i += 1
-
-################################################################################
-
-class Canvas(tk.Canvas):
-    '''Canvas inhereted from the Tkinter Canvas widget charged of canvas object creation and storage'''
-    def __init__(self, main, root):
-        '''Stores the adresses of Main and Win'''
-        super().__init__(root, width=750, height=375, highlightbackground='black', highlightthickness=3)
-        self.grid(row=3, column=1, columnspan=15 , padx=10, pady=5)
-
-        self.Win = root
-        self.Main = main
-
-
-    def SetMenu(self, level_list):
-        '''Diplays the Canvas part of the menu
-        Draws the level buttons from a text object and a rectangle object with the name of their level in the tags'''
-        menu_buttons_pos = ((135,110),(295,110),(455,110),(615,110),(135,265),(295,265),(455,265),(615,265))
-        i = 0
-        for posx, posy in menu_buttons_pos:
-            self.create_rectangle(posx-60, posy-35, posx+60, posy+35, fill='SteelBlue3', outline="grey26",width=5, tags=(level_list[i], "Menu_Objects"))
-            self.create_text(posx, posy, text=level_list[i], font=("Arial", 25), tags=(level_list[i], "Menu_Objects"))
-            i += 1
-
-    def SetLevel(self, level):
-        '''Draws the Canvas part of a level,
-        extracting the level's informations from its json file and displaying them'''
-        self.delete('Menu_Objects', 'Level_Object')
-
-        # Drawing the grid
-        for i in range(10):
-            self.create_line(75*i,0,75*i,375, fill="black", width=2, tags=('grid', 'Level_Object'))
-        for i in range(5):
-            self.create_line(0,75*i,750,75*i, fill="black", width=2, tags=('grid', 'Level_Object'))
-
-        with open(self.Main.Level_Folder_Path + level +'.json', 'r') as f:
-            lv_data = json.load(f)
-
-        player_coo = lv_data['Player_Starter_Coo']
-        victory_cell_coo = lv_data['Victory_Cell_Starting_Coo']
-        red_cells = lv_data['Red_Cells_Starter_Coo']
-        arrows = lv_data['Arrow']
-
-        self.create_rectangle(player_coo[0]+10, player_coo[1]+10, player_coo[0]+65, player_coo[1]+65, fill='blue', tags=('Player_Cell', 'Level_Object'))
-        self.create_rectangle(victory_cell_coo[0]+5, victory_cell_coo[1]+5, victory_cell_coo[0]+70, victory_cell_coo[1]+70, outline='blue', width=10, tags=('Victory_Cell', 'Level_Object'))
-
-        for red_cell in red_cells:
-            self.create_rectangle(red_cell[0]+5, red_cell[1]+5, red_cell[0]+70, red_cell[1]+70, outline='red', width=10, tags=('Red_Cell', 'Level_Object'))
-
-        for arrow in arrows:
-            if len(arrow) < 5:
-                self.create_text(arrow[0]*75+37.5, arrow[1]*75+37.5, text=arrow[2], fill=arrow[3], font=("Arial", 28), tags=('arrows', 'Level_Object'))
-            else:
-                match arrow[-1]:
-                    case 'left':
-                        self.create_text(arrow[0]*75+27.5, arrow[1]*75+37.5, text=arrow[2], fill=arrow[3], font=("Arial", 28), tags=('arrows', 'Level_Object'))
-                    case 'right':
-                        self.create_text(arrow[0]*75+47.5, arrow[1]*75+37.5, text=arrow[2], fill=arrow[3], font=("Arial", 28), tags=('arrows', 'Level_Object'))
-                    case 'up':
-                        self.create_text(arrow[0]*75+37.5, arrow[1]*75+27.5, text=arrow[2], fill=arrow[3], font=("Arial", 28), tags=('arrows', 'Level_Object'))
-                    case 'down':
-                        self.create_text(arrow[0]*75+37.5, arrow[1]*75+47.5, text=arrow[2], fill=arrow[3], font=("Arial", 28), tags=('arrows', 'Level_Object'))
-                    case _:
-                        print('arrow position unknown')
-
-
-    def CanPlayerUpdate(self):
-        '''Erases the Player Cell and draws it at the new position'''
-        self.delete('Player_Cell')
-
-        self.create_rectangle(self.Main.Level.player_coo[0]+10,
-                              self.Main.Level.player_coo[1]+10,
-                              self.Main.Level.player_coo[0]+65,
-                              self.Main.Level.player_coo[1]+65,
-                              fill='blue', tags=('Player_Cell', 'Level_Object'))
-
-    def CanCellUpdate(self):
-        '''Erases the Victory and Red Cells and draws them at their new position'''
-        self.delete('Victory_Cell', 'Red_Cell')
-
-        self.create_rectangle(self.Main.Level.victory_cell_coo[self.Main.Level.step-1][0]+5,
-                              self.Main.Level.victory_cell_coo[self.Main.Level.step-1][1]+5,
-                              self.Main.Level.victory_cell_coo[self.Main.Level.step-1][0]+70,
-                              self.Main.Level.victory_cell_coo[self.Main.Level.step-1][1]+70,
-                              outline='blue', width=10, tags=('Victory_Cell', 'Level_Object'))
-
-        for red_cell in self.Main.Level.red_cells:
-            self.create_rectangle(red_cell[self.Main.Level.step-1][0]+5,
-                                  red_cell[self.Main.Level.step-1][1]+5,
-                                  red_cell[self.Main.Level.step-1][0]+70,
-                                  red_cell[self.Main.Level.step-1][1]+70,
-                                  outline='red', width=10, tags=('Red_Cell', 'Level_Object'))
-
-    def VictoryAnimation(self):
-        '''Plays the victory animation requiring the tksleep method created in the initialisation of the Win
-        to add delay in a concise and intuitive way'''
-
-        self.Win.tksleep(0.5)
-        self.create_rectangle(225 , 110, 525, 265, outline='black', width=5, fill='white', tags='Level_Object')
-        self.Win.tksleep(0.5)
-
-        text = self.Main.current_level
-        Victory_Level_Text = self.create_text(375, 160, font=('Helvetica 35 bold'), tags="Level_Object")
-        for i in range(len(text)):
-            self.itemconfig(Victory_Level_Text, text=text[0:i+1])
-            self.Win.tksleep(0.1)
-
-        text = 'Victory'
-        Victory_Message_Text = self.create_text(375, 215 ,font=('Helvetica 35 bold'), tags="Level_Object")
-        for i in range(len(text)):
-            self.itemconfig(Victory_Message_Text, text=text[0:i+1])
-            self.Win.tksleep(0.1)
-
-        self.Win.tksleep(1)
-        for i in range(5):
-            for j in range(5):
-                self.create_rectangle(i*75,j*75,i*75+75,j*75+75,width=0, fill='blue', tags='Level_Object')
-                self.create_rectangle(750-(i*75),375-(j*75),750-(i*75+75),375-(j*75+75),width=0, fill='blue', tags='Level_Object')
-                self.Win.tksleep(0.06)
-
-    def DeathAnimation(self):
-        '''Plays the death animation, also using the tklsleep method'''
-        self.delete("Player_Cell")
-        circle_size = 10
-        for i in range(5):
-            self.create_oval(self.Main.Level.player_coo[0]+10-circle_size*i,
-                             self.Main.Level.player_coo[1]+10-circle_size*i,
-                             self.Main.Level.player_coo[0]+60+circle_size*i,
-                             self.Main.Level.player_coo[1]+60+circle_size*i, outline='blue', width=20, tags="death_circle")
-            self.Win.tksleep(0.05)
-            self.delete("death_circle")
-
-class LevelOperator:
-    '''Class operating the running time of a level'''
-    def __init__(self, main):
-        '''Storing the Main object adresses'''
-        self.Main = main
-
-
-    def RunLevel(self, level):
-        '''The name is self explanatory, called when a level in ran
-        Extracting the level data from its file and starting a recursive loop alternating between player and cell movement
-        checking if the player won or lost at every step'''
-
-        self.current_level = level
-        self.step = 0
-
-        with open(self.Main.Level_Folder_Path + level +'.json', 'r') as f:
-            lv_data = json.load(f)
-
-        self.player_coo = lv_data['Player_Starter_Coo']
-        self.victory_cell_coo = lv_data['Victory_Cell_Move']
-        self.red_cells = lv_data['Red_Cells_Move']
-
-        self.PlayerMove()
-
-
-    def PlayerMove(self):
-        '''Updates the player position according to the next move stored in the Pile
-        Calls Win to update the Labels and Canvas
-        Checks the victory and failure conditions then calls the next step in the recursive loop'''
-        # Update Player Coo
-        direction = self.Main.Pile[self.step]
-
-        match direction:
-            case 'Up':
-                self.player_coo[1] -= 75
-            case 'Down':
-                self.player_coo[1] += 75
-            case 'Left':
-                self.player_coo[0] -= 75
-            case 'Right':
-                self.player_coo[0] += 75
-
-
-        self.Main.Win.PlayerUpdate()
-
-        if self.CheckVictory():
-            self.Main.Victory()
-
-        elif self.CheckRedCells()\
-        or self.CheckBound():
-            self.Main.ResetLevel()
-
-        else:
-            self.Main.Win.after(300, self.CellMove)
-
-
-    def CellMove(self):
-        '''Updates the step
-        Calls Win to update the Labels and Canvas
-        Checks the victory and failure conditions then calls PlayerMove back'''
-        self.step += 1
-        self.Main.Win.CellUpdate()
-
-        if self.CheckVictory():
-            self.Main.Victory()
-
-        elif self.CheckRedCells()\
-        or self.CheckMoves():
-            self.Main.ResetLevel()
-
-        else:
-            self.Main.Win.after(300, self.PlayerMove)
-
-    def CheckBound(self) -> bool:
-        '''True if the player position is outside of the canvas'''
-        return self.player_coo[0] < 0 or self.player_coo[0] >= 750 or self.player_coo[1] < 0 or self.player_coo[1] >= 375
-
-    def CheckVictory(self) -> bool:
-        '''True if the player encountered the victory cell'''
-        return self.player_coo == self.victory_cell_coo[self.step-1]
-
-    def CheckRedCells(self) -> bool:
-        '''True if the player encountered a red cell'''
-        return self.player_coo in [red_cell[self.step-1] for red_cell in self.red_cells]
-
-    def CheckMoves(self) -> bool:
-        '''True if the player has reached his last move inputed'''
-        return self.step == len(self.Main.Pile)
-
-
-
-if __name__ == '__main__':
-    Main()
+import tkinter as tk
+import os
+import sys
+import json
+import re
+import math
+import time
+import random
+import bisect
+import hashlib
+import cProfile
+import mmap
+import sqlite3
+import struct
+import argparse
+import platform
+import functools
+import itertools
+import contextlib
+import subprocess
+import threading
+import queue
+import socket
+import stat
+import tracemalloc
+from types import SimpleNamespace
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# NumPy is only needed by the BatchVerifier, it is imported by BatchVerifier.Available the first time
+# a BatchVerifier is wanted, so the game doesn't pay for its import and runs without it
+np = None
+
+class Main:
+    '''Main class used to connect the other objects'''
+    def __init__(self):
+        '''Creates the other objects'''
+        self.Level_Folder_Path = os.path.join(os.getcwd(), 'Level_Folder')
+
+        self.Levels = LevelRepository(self.Level_Folder_Path)
+        self.Catalog = LevelCatalog(self.Level_Folder_Path)
+        self.Solutions = SolutionCache(os.path.join(os.getcwd(), SolutionCache.FILE_NAME))
+        self.Attempts = AttemptLog(os.path.join(os.getcwd(), AttemptLog.FILE_NAME))
+        self.Instruments = Instrumentation()
+
+        self.Win = Root(self)
+        self.Level = LevelOperator(self)
+        self.Solver = Solver()
+        self.Simulator = Simulator()
+        self.Solving = None # SolveTask of the Auto Solve running
+        self.Hints = None # HintTable of the last level called
+
+        self.Win.SetMenu()
+
+        self.Win.mainloop()
+        self.UseAttempts(AttemptLog.Flush)
+        self.UseSolutions(SolutionCache.Flush)
+        if self.Instruments.enabled:
+            self.Instruments.Disable()
+            self.Instruments.Write(os.path.join(os.getcwd(), Instrumentation.FILE_NAME))
+
+    @property
+    def Level_Files_List(self) -> list:
+        '''Method binded with the Property decorator to be called like an attribut,
+        returning the list of the names of the json files stored in the folder Level_Folder,
+        from the LevelCatalog which only lists the folder again when it changed'''
+
+        return self.Catalog.Names()
+
+    @staticmethod
+    def ListLevelFiles(folder_path) -> list:
+        '''Returns the natural sorted names of the json files stored in the folder, usable without a window'''
+        return LevelCatalog(folder_path).Names()
+
+
+    def CallMenu(self):
+        '''Prepares the game to open the menu by destroying the widget buttons from levels,
+        cleaning the labels and canvas, and unbinding the keyboard before openning the Menu screen.
+        An Auto Solve still running is cancelled and the attempts logged are written'''
+        self.CancelAutoSolve()
+        self.UseAttempts(AttemptLog.Flush)
+        self.Win.Menu_Button.destroy()
+        self.Win.Recur_Button.destroy()
+        self.Win.ReselLabels()
+        self.Win.Canvas.delete('Level_Object')
+        self.Win.unbind('<Key>')
+        self.Win.SetMenu()
+
+    def CallLevel(self, level_name):
+        '''Setup the level called by calling the Win method displaying it,
+        creating and reseting the needed attributs and binding the keyboard
+        to detect key presses'''
+        self.Win.SetLevel(level_name)
+        self.current_level = level_name
+        level = self.Levels.Get(level_name)
+        self.move_limit = level.move_limit
+        self.Pile = []
+        self.Win.bind('<Key>', self.KeyPress)
+
+        # The HintTable is only computed again when the level changed
+        if self.Hints is None or self.Hints.level is not level:
+            self.Hints = HintTable(level)
+        # State of the player after each move of the Pile : (cell, outcome of the move or None)
+        self.Pile_States = [(level.player_start, None)]
+
+
+    def KeyPress(self, event):
+        '''Method binded to the entire keyboard during a level and reacting to
+        the arrows as player path input, storing them,
+        the backspace to delete inputs,
+        h to display a hint for the moves stored,
+        and Enter (Return) key to start the level'''
+        key_pressed = event.keysym
+        if key_pressed == 'Return'\
+        and len(self.Pile) > 0:
+            self.CancelAutoSolve()
+            self.Win.Menu_Button.destroy()
+            self.Win.Recur_Button.destroy()
+            self.Win.unbind('<Key>')
+            self.Level.RunLevel(self.current_level)
+            return
+
+        elif key_pressed == 'BackSpace'\
+        and len(self.Pile) > 0:
+            self.Pile.pop()
+            self.Pile_States.pop()
+
+        elif key_pressed in ('Up','Down','Left','Right')\
+        and len(self.Pile) < self.move_limit:
+            self.Pile.append(key_pressed)
+            cell, outcome = self.Pile_States[-1]
+            if outcome is None:
+                self.Pile_States.append(self.Simulator.Step(self.Hints.level, cell, len(self.Pile)-1, key_pressed))
+            else:
+                self.Pile_States.append((cell, outcome)) # The run already ended, the next moves are never played
+
+        elif key_pressed == 'h':
+            cell, outcome = self.Pile_States[-1]
+            moves = self.Hints.NextMoves(len(self.Pile), cell) if outcome is None else []
+            self.Win.DisplayHint(outcome, moves)
+            return
+
+        self.Win.location.set(self.current_level)
+        self.Win.UpdateInputLabels()
+
+
+    def Victory(self):
+        '''Called when victory occurs, playing the victory animation which calls the Menu once done'''
+        self.Win.Canvas.VictoryAnimation(self.CallMenu)
+
+    def ResetLevel(self):
+        '''Called when a lose occurs, playing the death animation which restarts the level once done'''
+        self.Win.Canvas.DeathAnimation(self.RestartLevel)
+
+    def RestartLevel(self):
+        '''Stores the moves played in the Memory Labels and calls the level back'''
+        self.Win.UpdateMemoryLabel()
+        self.CallLevel(self.current_level)
+
+
+    def StartAutoSolve(self):
+        '''Binded with the AutoSolve Button, it gets the level from the LevelRepository
+        and starts the Solver in a SolveTask, unless one is already running'''
+        if self.Solving is not None:
+            return
+
+        level = self.Levels.Get(self.current_level)
+        cached = self.UseSolutions(SolutionCache.Get, level)
+        if cached is not None:
+            self.Win.DisplayAutoSolve(cached.path)
+            return
+
+        self.Solving = SolveTask(level)
+        self.PollAutoSolve(self.Solving)
+
+    def PollAutoSolve(self, task):
+        '''Displays the progress of the task every 100 ms,
+        then sends the shortest path found to the method displaying it'''
+        if task is not self.Solving:
+            return # Cancelled
+
+        if task.done and task.result is None:
+            self.Solving = None
+            self.Win.DisplayAutoSolveError(task.error)
+        elif task.done:
+            self.Solving = None
+            self.UseSolutions(SolutionCache.Put, task.level, task.result.path)
+            self.Win.DisplayAutoSolve(task.result.path)
+        else:
+            self.Win.DisplayAutoSolveProgress(task.depth, task.states)
+            self.Win.after(100, self.PollAutoSolve, task)
+
+    def UseSolutions(self, method, *args):
+        '''Calls the SolutionCache method and returns its result, None when the store can't be used
+        (read only folder, broken file), the levels being solved without it afterwards'''
+        if self.Solutions is None:
+            return None
+        try:
+            return method(self.Solutions, *args)
+        except sqlite3.Error as error:
+            print('solution cache disabled :', error)
+            self.Solutions = None
+            return None
+
+    def UseAttempts(self, method, *args):
+        '''Calls the AttemptLog method, the logging is stopped when the log can't be written
+        (read only folder, full disk) so the game goes on without it'''
+        if self.Attempts is None:
+            return
+        try:
+            method(self.Attempts, *args)
+        except OSError as error:
+            print('attempt log disabled :', error)
+            self.Attempts = None
+
+    def CancelAutoSolve(self):
+        '''Stops the Auto Solve running, if any'''
+        if self.Solving is not None:
+            self.Solving.Cancel()
+            self.Solving = None
+
+################################################################################
+
+class Root(tk.Tk):
+    '''Root class, inhereted from the Tk window class in charge of the widgets'''
+    def __init__(self, main):
+        '''Creates the Timeline running the animations,
+        Stores the address of Main,
+        Creates the Labels, storing their adresses in lists'''
+        super().__init__()
+
+        self.Main = main
+        self.Timeline = Timeline(self)
+        self.menu_page = 0
+        self.flush_pending = False
+        self.Canvas = Canvas(self.Main, self)
+
+        # Escape skips the animation playing, F2 switches the turbo mode,
+        # F3 the instrumentation and its overlay, with cProfile if Shift is held
+        self.bind('<Escape>', lambda event: self.Timeline.Skip())
+        self.bind('<F2>', self.SwitchTurbo)
+        self.bind('<F3>', lambda event: self.SwitchInstruments(profile=False))
+        self.bind('<Shift-F3>', lambda event: self.SwitchInstruments(profile=True))
+
+        self.title("OverMove")
+        self.geometry("%dx%d" % (800,600)) # window size
+        self.resizable(0,0)
+
+        self.CharacterConversion = {
+            'Up'    : '⮝', '0,-75' : '⮝',
+            'Down'  : '⮟', '0,75'  : '⮟',
+            'Left'  : '⮜', '-75,0' : '⮜',
+            'Right' : '⮞', '75,0'  : '⮞'}
+        ### Labels Creation ###
+        # invisible Label to pad the other widgets
+        tk.Label(self, width = 0).grid(row=0, column=0, padx = 4)
+
+        # Location Text Label
+        tk.Label(self, width = 1, height = 3, pady = 7, bg='white', borderwidth=3, relief="solid").grid(row=0, column=1, columnspan=10, sticky='ew', pady = 5)
+        self.location = tk.StringVar()
+        tk.Label(self, textvariable = self.location, width = 1, height = 1, font=('Arial', 20), bg='white', pady = 7, anchor="w", justify="left").grid(row=0, column=2, columnspan=9, sticky='ew', pady = 5)
+
+        # The Input and Memory labels are created by SetLabelCount, one per move of the level
+        self.Input_Label_List = []
+        self.Memory_Label_List = []
+        self.SetLabelCount(15)
+
+    def SetLabelCount(self, count):
+        '''Creates the Input and Memory labels, one for each move allowed by the level.
+        Past 15 moves the labels continue on more rows, the canvas being placed below them'''
+        if count == len(self.Input_Label_List):
+            return
+
+        for label in self.Input_Label_List + self.Memory_Label_List:
+            label.destroy()
+        rows = (count + 14) // 15
+
+        # Creating the textvars for the Input labels
+        self.Input_Label_Textvariable_List = [tk.StringVar() for _ in range(count)]
+        # Creating the Input Labels
+        self.Input_Label_List = [
+            tk.Label(self, textvariable = Textvar, width = 1, height = 1, bg="white", borderwidth=3, relief="solid", font=('Arial', 25), pady = 4)
+            for Textvar in self.Input_Label_Textvariable_List
+            ]
+        # Placing the Input labels on the grid
+        i = 0
+        for label in self.Input_Label_List:
+            label.grid(row=1+rows+i//15, column=i%15+1, sticky='ew', pady = 5)
+            i += 1
+
+        # Creating the textvars for the Memory labels
+        self.Memory_Label_Textvariable_List = [tk.StringVar() for _ in range(count)]
+        # Creating the Memory labels
+        self.Memory_Label_List = [
+            tk.Label(self, textvariable = Textvar, width = 1, height = 1, bg="white", borderwidth=3, relief="solid", font=('Arial', 25), pady = 4)
+            for Textvar in self.Memory_Label_Textvariable_List
+            ]
+        # Placing the Memory labels on the grid
+        i = 0
+        for label in self.Memory_Label_List:
+            label.grid(row=1+i//15, column=i%15+1, sticky='ew', pady = 5)
+            i += 1
+
+        # View-models of the rows, the labels are only written by FlushLabels
+        self.Inputs = LabelRow(self, self.Input_Label_List, self.Input_Label_Textvariable_List)
+        self.Memories = LabelRow(self, self.Memory_Label_List, self.Memory_Label_Textvariable_List)
+
+        self.Canvas.grid(row=1+2*rows)
+
+    def SwitchTurbo(self, event=None):
+        '''Switches the turbo mode compressing the step cadence and the animations'''
+        self.Timeline.speed = 1 if self.Timeline.speed != 1 else Timeline.TURBO
+        self.title("OverMove" if self.Timeline.speed == 1 else "OverMove (turbo)")
+
+    def SwitchInstruments(self, profile):
+        '''Enables the instrumentation and shows its overlay,
+        or disables it and writes its stats next to the level folder'''
+        instruments = self.Main.Instruments
+        if instruments.enabled:
+            instruments.Disable()
+            instruments.Write(os.path.join(os.getcwd(), Instrumentation.FILE_NAME))
+        else:
+            instruments.Enable(profile)
+        self.UpdateOverlay()
+
+    def UpdateOverlay(self):
+        '''Displays the instrumentation stats over the canvas every 500 ms while it is enabled'''
+        # The tk.Canvas methods are called directly so the overlay is not counted in the canvas counters,
+        # and it is disabled so the clicks go to the menu buttons under it
+        tk.Canvas.delete(self.Canvas, 'Overlay')
+        if not self.Main.Instruments.enabled:
+            return
+        tk.Canvas.create_text(self.Canvas, 8, 8, text=self.Main.Instruments.Report(), anchor='nw', font=('Courier', 9), fill='gray20', state='disabled', tags='Overlay')
+        self.after(500, self.UpdateOverlay)
+
+    def MenuClick(self, event):
+        '''Calls the level stored in the tags of the last Canvas object clicked,
+        or turns the menu page for the page buttons. Other objects are ignored'''
+        element_tags = self.Canvas.gettags("current")
+
+        if 'Page_Button' in element_tags:
+            self.menu_page += 1 if 'Next_Page' in element_tags else -1
+            self.Canvas.delete('Menu_Objects')
+            self.SetMenu()
+            return
+
+        if 'Level_Button' in element_tags:
+            self.Main.CallLevel(element_tags[0])
+
+
+    def SetMenu(self):
+        '''Displays the menu screen'''
+        self.location.set("Menu")
+
+        self.SetLabelCount(15)
+        self.geometry("%dx%d" % (800,600))
+
+        # Only the levels of the page shown are drawn, the page is kept when coming back from a level
+        page_count = self.Main.Catalog.PageCount(len(Canvas.MENU_BUTTONS_POS))
+        self.menu_page = min(max(self.menu_page, 0), page_count-1)
+        self.Canvas.SetMenu(self.Main.Catalog.Page(self.menu_page, len(Canvas.MENU_BUTTONS_POS)), self.menu_page, page_count)
+
+        self.bind('<Button-1>', self.MenuClick)
+
+
+    def SetLevel(self, level):
+        '''Displays the level called'''
+        self.location.set(level)
+
+        self.unbind('<Button-1>')
+
+        self.Recur_Button = tk.Button(self, text ='Auto Solve', font=('Arial', 18), bg='white', pady = 9, relief=tk.SOLID, borderwidth=3, command = self.Main.StartAutoSolve)
+        self.Recur_Button.grid(row=0, column=13, columnspan=3, sticky='ew')
+
+        self.Menu_Button = tk.Button(self, text ='Menu', font=('Arial', 18), bg='white', pady = 9, relief=tk.SOLID, borderwidth=3, command = self.Main.CallMenu)
+        self.Menu_Button.grid(row=0, column=11, columnspan=2, sticky='ew')
+
+        level_data = self.Main.Levels.Get(level)
+        self.SetLabelCount(level_data.move_limit)
+        self.Canvas.SetLevel(level)
+
+        # The window grows with the board and the labels when they don't fit the default size
+        if level_data.width*level_data.cell_size > 750 or level_data.height*level_data.cell_size > 375 or level_data.move_limit > 15:
+            self.geometry('')
+
+    def RequestFlush(self):
+        '''Schedules FlushLabels once for the current event loop tick'''
+        if not self.flush_pending:
+            self.flush_pending = True
+            self.after_idle(self.FlushLabels)
+
+    def FlushLabels(self):
+        '''Writes the label changes asked since the last flush'''
+        self.flush_pending = False
+        self.Inputs.Flush()
+        self.Memories.Flush()
+
+    def UpdateInputLabels(self):
+        '''Updates every Input Label. Called after player input'''
+        for i in range(len(self.Inputs)):
+            if i < len(self.Main.Pile):
+                self.Inputs.Set(i, self.CharacterConversion[self.Main.Pile[i]])
+
+            else:
+                self.Inputs.Set(i, '')
+
+    def PlayerUpdate(self):
+        '''Changes the background of the label containing the current player move played,
+        Calls Canvas to update player cell'''
+        self.Inputs.Set(self.Main.Level.step-1, colour="white")
+        self.Inputs.Set(self.Main.Level.step, colour="cornflower blue")
+        self.Canvas.CanPlayerUpdate()
+
+    def CellUpdate(self):
+        '''Calls Canvas to update the victory and red cells'''
+        self.Canvas.CanCellUpdate()
+
+    def UpdateMemoryLabel(self):
+        '''Called when reseting a level
+        Stores the moves from the Input Labels to the Memory Labels before reseting the Input Labels
+        Colors the background of the Memory Label containing the last instruction played'''
+        for i in range(len(self.Inputs)):
+            self.Memories.Set(i, self.Inputs.texts[i], "white")
+            self.Inputs.Set(i, '', "white")
+
+        self.Memories.Set(self.Main.Level.step-1, colour="firebrick1")
+
+    def ReselLabels(self):
+        '''Resets the colour and text of the Input and Memory Labels'''
+        for i in range(len(self.Inputs)):
+            self.Inputs.Set(i, '', "white")
+            self.Memories.Set(i, '', "white")
+
+    def DisplayHint(self, outcome, moves):
+        '''Displays next to the level name whether the moves stored still win and the moves keeping them winnable,
+        outcome being the end of the run if the moves stored already end it'''
+        if outcome == Simulator.VICTORY:
+            hint = 'these moves already win'
+        elif outcome is not None:
+            hint = 'these moves already lose'
+        elif moves:
+            hint = 'hint : ' + ' or '.join(self.CharacterConversion[move] for move in moves)
+        else:
+            hint = 'no win from here'
+        self.location.set('%s   %s' % (self.Main.current_level, hint))
+
+    def DisplayAutoSolveProgress(self, depth, states):
+        '''Displays the progress of the AutoSolve running next to the level name'''
+        self.location.set('%s   solving : %d moves, %d states' % (self.Main.current_level, depth, states))
+
+    def DisplayAutoSolveError(self, error):
+        '''Displays why the AutoSolve failed next to the level name'''
+        self.location.set('%s   Auto Solve failed : %s' % (self.Main.current_level, error))
+
+    def DisplayAutoSolve(self, path):
+        '''Display results of AutoSolve in memory label,
+        path is the list of moves returned by the Solver, None if the level can't be solved'''
+        self.location.set(self.Main.current_level)
+
+        if path is None:
+            path = []
+
+        for i in range(len(self.Memories)):
+            self.Memories.Set(i, self.CharacterConversion[path[i]] if i < len(path) else '', "white")
+
+
+class LabelRow:
+    '''View-model of a row of labels : the texts and colours asked are stored,
+    and Flush only writes the labels whose text or colour differs from the one shown,
+    Root coalescing the flushes to one per event loop tick'''
+    def __init__(self, root, labels, textvariables):
+        '''Stores the labels, all created empty and white'''
+        self.Win = root
+        self.labels = labels
+        self.textvariables = textvariables
+
+        self.texts = [''] * len(labels)
+        self.colours = ['white'] * len(labels)
+        self.shown = [('', 'white')] * len(labels)
+        self.dirty = set()
+        self.updates = 0 # Tcl calls made by the flushes
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def Set(self, i, text=None, colour=None):
+        '''Asks for a text and/or colour on the label i, negative indexes counting from the end'''
+        i %= len(self.labels)
+        if text is not None:
+            self.texts[i] = text
+        if colour is not None:
+            self.colours[i] = colour
+        self.dirty.add(i)
+        self.Win.RequestFlush()
+
+    def Flush(self):
+        '''Writes the labels that changed since they were shown'''
+        for i in self.dirty:
+            text, colour = self.shown[i]
+            if self.texts[i] != text:
+                self.textvariables[i].set(self.texts[i])
+                self.updates += 1
+            if self.colours[i] != colour:
+                self.labels[i].config(bg=self.colours[i])
+                self.updates += 1
+            self.shown[i] = (self.texts[i], self.colours[i])
+        self.dirty.clear()
+
+################################################################################
+
+class Canvas(tk.Canvas):
+    '''Canvas inhereted from the Tkinter Canvas widget charged of canvas object creation and storage.
+    The level objects are created once by SetLevel, their item ids are kept in a table
+    and every step only moves the items whose cell changed'''
+
+    # Positions of the level buttons of a menu page
+    MENU_BUTTONS_POS = ((135,110),(295,110),(455,110),(615,110),(135,265),(295,265),(455,265),(615,265))
+    def __init__(self, main, root):
+        '''Stores the adresses of Main and Win'''
+        super().__init__(root, width=750, height=375, highlightbackground='black', highlightthickness=3)
+        self.grid(row=3, column=1, columnspan=15 , padx=10, pady=5)
+
+        self.Win = root
+        self.Main = main
+
+        # Frame counters, reset by SetLevel
+        self.frames = 0
+        self.frame_time = 0.0
+        self.moved_items = 0
+
+
+    def SetMenu(self, level_list, page=0, page_count=1):
+        '''Diplays the Canvas part of the menu, level_list holding the levels of the page shown
+        Draws the level buttons from a text object and a rectangle object with the name of their level as first tag,
+        then the page buttons, with the direction they turn the pages to in the tags, when there are several pages'''
+        self.config(width=750, height=375)
+        for (posx, posy), level in zip(self.MENU_BUTTONS_POS, level_list):
+            self.create_rectangle(posx-60, posy-35, posx+60, posy+35, fill='SteelBlue3', outline="grey26",width=5, tags=(level, 'Level_Button', "Menu_Objects"))
+            # Long names get a smaller font to stay inside their button
+            self.create_text(posx, posy, text=level, font=("Arial", min(25, max(10, 175 // max(len(level), 1)))), tags=(level, 'Level_Button', "Menu_Objects"))
+
+        if page_count > 1:
+            self.create_text(375, 340, text='%d / %d' % (page+1, page_count), font=("Arial", 18), tags="Menu_Objects")
+            for posx, direction, text, shown in ((295, 'Previous_Page', '⮜', page > 0), (455, 'Next_Page', '⮞', page < page_count-1)):
+                if shown:
+                    self.create_rectangle(posx-30, 322, posx+30, 358, fill='SteelBlue3', outline="grey26", width=3, tags=('Page_Button', direction, "Menu_Objects"))
+                    self.create_text(posx, 340, text=text, font=("Arial", 18), tags=('Page_Button', direction, "Menu_Objects"))
+
+    def SetLevel(self, level):
+        '''Draws the Canvas part of a level,
+        getting the level's informations from the LevelRepository and displaying them'''
+        self.delete('Menu_Objects', 'Level_Object')
+
+        level = self.Main.Levels.Get(level)
+
+        # Sizes are given for 75 pixel cells and scaled to the cell size of the level
+        cell = level.cell_size
+        scale = cell / 75
+        self.config(width=level.width*cell, height=level.height*cell)
+
+        # Drawing the grid
+        for i in range(level.width):
+            self.create_line(cell*i,0,cell*i,level.height*cell, fill="black", width=2, tags=('grid', 'Level_Object'))
+        for i in range(level.height):
+            self.create_line(0,cell*i,level.width*cell,cell*i, fill="black", width=2, tags=('grid', 'Level_Object'))
+
+        self.level = level
+        self.scale = scale
+        arrows = level.arrows
+
+        self.player_item = self.create_rectangle(*self.Box(level.Coo(level.player_start), 10), fill='blue', tags=('Player_Cell', 'Level_Object'))
+
+        # Item table of the moving cells, the victory cell first, and the start and moves of each one
+        self.cell_items = [self.create_rectangle(*self.Box(level.Coo(level.victory_start), 5), outline='blue', width=10*scale, tags=('Victory_Cell', 'Level_Object'))]
+        for red_start in level.red_starts:
+            self.cell_items.append(self.create_rectangle(*self.Box(level.Coo(red_start), 5), outline='red', width=10*scale, tags=('Red_Cell', 'Level_Object')))
+        self.tracks = [(level.victory_start, level.victory_move)] + list(zip(level.red_starts, level.red_move))
+
+        # Indexes of the items moving at each step, so a step costs the cells that moved and not every red cell.
+        # Filled when a step is first shown, a long level doesn't pay for the steps never reached
+        self.changes = {}
+        self.shown_step = 0
+
+        self.frames = 0
+        self.frame_time = 0.0
+        self.moved_items = 0
+
+        font = ("Arial", max(1, round(28*scale)))
+        for arrow in arrows:
+            if len(arrow) < 5:
+                self.create_text(arrow[0]*cell+37.5*scale, arrow[1]*cell+37.5*scale, text=arrow[2], fill=arrow[3], font=font, tags=('arrows', 'Level_Object'))
+            else:
+                match arrow[-1]:
+                    case 'left':
+                        self.create_text(arrow[0]*cell+27.5*scale, arrow[1]*cell+37.5*scale, text=arrow[2], fill=arrow[3], font=font, tags=('arrows', 'Level_Object'))
+                    case 'right':
+                        self.create_text(arrow[0]*cell+47.5*scale, arrow[1]*cell+37.5*scale, text=arrow[2], fill=arrow[3], font=font, tags=('arrows', 'Level_Object'))
+                    case 'up':
+                        self.create_text(arrow[0]*cell+37.5*scale, arrow[1]*cell+27.5*scale, text=arrow[2], fill=arrow[3], font=font, tags=('arrows', 'Level_Object'))
+                    case 'down':
+                        self.create_text(arrow[0]*cell+37.5*scale, arrow[1]*cell+47.5*scale, text=arrow[2], fill=arrow[3], font=font, tags=('arrows', 'Level_Object'))
+                    case _:
+                        print('arrow position unknown')
+
+
+    def Box(self, coo, inset) -> tuple:
+        '''Returns the coordinates of a square drawn inside the cell of the given top left corner,
+        inset being given for 75 pixel cells'''
+        x, y = coo
+        return (x+inset*self.scale, y+inset*self.scale, x+(75-inset)*self.scale, y+(75-inset)*self.scale)
+
+    def CanPlayerUpdate(self):
+        '''Moves the Player Cell to its new position'''
+        start = time.perf_counter()
+
+        player_coo = self.Main.Level.player_coo
+        self.coords(self.player_item, *self.Box(player_coo, 10))
+
+        self.frames += 1
+        self.moved_items += 1
+        self.frame_time += time.perf_counter() - start
+
+    def CanCellUpdate(self):
+        '''Moves the Victory and Red Cells whose cell changed since the step shown'''
+        start = time.perf_counter()
+
+        step = self.Main.Level.step
+        if step == self.shown_step + 1:
+            moved = self.changes.get(step)
+            if moved is None:
+                moved = self.changes[step] = tuple(i for i in range(len(self.tracks)) if self.TrackCell(i, step) != self.TrackCell(i, step-1))
+        else:
+            # Not the next step, every cell is placed again
+            moved = range(len(self.cell_items))
+        for i in moved:
+            self.coords(self.cell_items[i], *self.Box(self.level.Coo(self.TrackCell(i, step)), 5))
+        self.shown_step = step
+
+        self.frames += 1
+        self.moved_items += len(moved)
+        self.frame_time += time.perf_counter() - start
+
+    def TrackCell(self, i, step) -> int:
+        '''Returns the cell of the moving item i at the given step, the step 0 being its start'''
+        start, move = self.tracks[i]
+        return move[step-1] if step else start
+
+    def Stats(self) -> dict:
+        '''Returns the frame counters since the level was set, the mean frame time should not grow with the red cells count'''
+        return {'frames': self.frames, 'moved_items': self.moved_items, 'frame_time': self.frame_time,
+                'mean_frame_time': self.frame_time / self.frames if self.frames else 0.0,
+                'red_cells': len(self.cell_items) - 1}
+
+    def VictoryAnimation(self, callback):
+        '''Plays the victory animation on the Timeline of the Win, then calls callback'''
+        timeline = self.Win.Timeline
+        level = self.Main.Level.level
+        cell = level.cell_size
+        width, height = level.width*cell, level.height*cell
+        # Center of the canvas
+        x, y = width/2, height/2
+
+        # The items are created hidden or empty and shown by the keyframes
+        box = self.create_rectangle(x-150 , y-77.5, x+150, y+77.5, outline='black', width=5, fill='white', state='hidden', tags='Level_Object')
+        timeline.Add(0.5, lambda: self.itemconfig(box, state='normal'))
+
+        delay = 0.5
+        for text, text_y in ((self.Main.current_level, y-27.5), ('Victory', y+27.5)):
+            text_item = self.create_text(x, text_y, font=('Helvetica 35 bold'), tags="Level_Object")
+            for i in range(len(text)):
+                timeline.Add(delay, lambda text_item=text_item, text=text[0:i+1]: self.itemconfig(text_item, text=text))
+                delay = 0.1
+
+        # The board is covered from both corners, faster on big boards to keep the same duration
+        columns = (level.width+1)//2
+        delay = 1
+        for i in range(columns):
+            for j in range(level.height):
+                timeline.Add(delay, lambda i=i, j=j: self.CoverCells(i, j))
+                delay = min(0.06, 1.5 / (columns*level.height))
+
+        timeline.Add(delay, callback)
+
+    def CoverCells(self, i, j):
+        '''Draws the two blue squares of the victory animation, one from each corner'''
+        level = self.Main.Level.level
+        cell = level.cell_size
+        width, height = level.width*cell, level.height*cell
+        self.create_rectangle(i*cell,j*cell,i*cell+cell,j*cell+cell,width=0, fill='blue', tags='Level_Object')
+        self.create_rectangle(width-(i*cell),height-(j*cell),width-(i*cell+cell),height-(j*cell+cell),width=0, fill='blue', tags='Level_Object')
+
+    def DeathAnimation(self, callback):
+        '''Plays the death animation on the Timeline of the Win, then calls callback'''
+        self.itemconfig(self.player_item, state='hidden')
+        for i in range(5):
+            self.Win.Timeline.Add(0.05 if i else 0, lambda i=i: self.DeathCircle(i))
+        self.Win.Timeline.Add(0.05, lambda: self.delete("death_circle"))
+        self.Win.Timeline.Add(0, callback)
+
+    def DeathCircle(self, i):
+        '''Replaces the circle of the death animation by the i-th one, growing around the player'''
+        self.delete("death_circle")
+        scale = self.Main.Level.level.cell_size / 75
+        circle_size = 10*scale
+        self.create_oval(self.Main.Level.player_coo[0]+10*scale-circle_size*i,
+                         self.Main.Level.player_coo[1]+10*scale-circle_size*i,
+                         self.Main.Level.player_coo[0]+60*scale+circle_size*i,
+                         self.Main.Level.player_coo[1]+60*scale+circle_size*i, outline='blue', width=20*scale, tags="death_circle")
+
+
+class Timeline:
+    '''Runs the keyframes of the animations and of the level steps from a single after callback,
+    so the event loop never nests and the window keeps answering during the animations.
+    Every keyframe is due at a time counted from the previous one, late keyframes are caught up
+    within the frame budget instead of shifting the ones after them'''
+    FRAME_BUDGET = 0.008 # seconds of keyframes run in one callback before giving the hand back to Tk
+    TURBO = 0.2 # delay factor of the turbo mode
+
+    def __init__(self, root):
+        '''Stores the address of the Win, creates the keyframe queue'''
+        self.Win = root
+        self.keyframes = deque() # (delay, action)
+        self.speed = 1
+        self.due = 0.0 # time the last keyframe ran, or was due
+        self.job = None
+
+    def Add(self, delay, action):
+        '''Queues action to be run delay seconds after the previous keyframe,
+        starting the timeline if it was idle'''
+        if not self.keyframes and self.job is None:
+            self.due = time.perf_counter()
+        self.keyframes.append((delay, action))
+        if self.job is None:
+            self.Schedule()
+
+    def Schedule(self):
+        '''Sets the after callback at the time the next keyframe is due'''
+        delay = self.due + self.keyframes[0][0]*self.speed - time.perf_counter()
+        self.job = self.Win.after(max(0, int(delay*1000)), self.Tick)
+
+    def Tick(self):
+        '''Runs the keyframes that are due, within the frame budget'''
+        start = now = time.perf_counter()
+        while self.keyframes and now - start < self.FRAME_BUDGET:
+            delay, action = self.keyframes[0]
+            due = self.due + delay*self.speed
+            if due > now:
+                break
+            self.keyframes.popleft()
+            self.due = due
+            action()
+            now = time.perf_counter()
+
+        self.job = None
+        if self.keyframes:
+            self.Schedule()
+
+    def Skip(self):
+        '''Fast forwards : runs every keyframe now, including the ones they queue'''
+        if self.job is not None:
+            self.Win.after_cancel(self.job)
+            self.job = None
+        while self.keyframes:
+            self.keyframes.popleft()[1]()
+        self.due = time.perf_counter()
+
+        # The keyframes run may have scheduled a callback for a queue that is now empty
+        if self.job is not None:
+            self.Win.after_cancel(self.job)
+            self.job = None
+
+class LevelOperator:
+    '''Class animating the running time of a level,
+    the outcome of the run is given beforehand by the Simulator sharing the rules with the tooling'''
+    def __init__(self, main):
+        '''Storing the Main object adresses'''
+        self.Main = main
+
+
+    def RunLevel(self, level):
+        '''The name is self explanatory, called when a level in ran
+        Getting the level from the LevelRepository and the outcome of the Pile from the Simulator,
+        then starting a recursive loop alternating between player and cell movement until the step the run ends'''
+
+        self.current_level = level
+        self.step = 0
+
+        self.level = self.Main.Levels.Get(level)
+        self.outcome, self.end_step, self.end_phase = self.Main.Simulator.Run(self.level, self.Main.Pile)
+        self.Main.UseAttempts(AttemptLog.Add, level, self.Main.Pile, self.outcome, self.end_step, self.end_phase)
+
+        # The player position is a new list, the shared Level object is never modified
+        self.player_coo = list(self.level.Coo(self.level.player_start))
+
+        self.PlayerMove()
+
+
+    def PlayerMove(self):
+        '''Updates the player position according to the next move stored in the Pile
+        Calls Win to update the Labels and Canvas
+        Ends the run if it ends on this move, else calls the next step in the recursive loop'''
+        # Update Player Coo
+        direction = self.Main.Pile[self.step]
+
+        match direction:
+            case 'Up':
+                self.player_coo[1] -= self.level.cell_size
+            case 'Down':
+                self.player_coo[1] += self.level.cell_size
+            case 'Left':
+                self.player_coo[0] -= self.level.cell_size
+            case 'Right':
+                self.player_coo[0] += self.level.cell_size
+
+
+        self.Main.Win.PlayerUpdate()
+
+        if self.step == self.end_step and self.end_phase == Simulator.PLAYER_PHASE:
+            self.EndLevel()
+
+        else:
+            self.Main.Win.Timeline.Add(0.3, self.CellMove)
+
+
+    def CellMove(self):
+        '''Updates the step
+        Calls Win to update the Labels and Canvas
+        Ends the run if it ends once the cells moved, else calls PlayerMove back'''
+        self.step += 1
+        self.Main.Win.CellUpdate()
+
+        if self.step-1 == self.end_step:
+            self.EndLevel()
+
+        else:
+            self.Main.Win.Timeline.Add(0.3, self.PlayerMove)
+
+    def EndLevel(self):
+        '''Calls the victory or the reset of the level depending on the outcome'''
+        if self.outcome == Simulator.VICTORY:
+            self.Main.Victory()
+
+        else:
+            self.Main.ResetLevel()
+
+
+################################################################################
+
+class Track:
+    '''Cells of a moving cell at every step, computed on the first read of a step and kept afterwards.
+    Indexed like the tuple of a Move list, negative indexes included, so the callers don't know the difference'''
+    __slots__ = ('function', 'length', 'memo')
+
+    def __init__(self, function, length):
+        '''Stores the function returning the cell of a step and the number of steps'''
+        self.function = function
+        self.length = length
+        self.memo = {}
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, step):
+        if isinstance(step, slice):
+            return tuple(self[i] for i in range(*step.indices(self.length)))
+        if step < 0:
+            step += self.length
+        if not 0 <= step < self.length:
+            raise IndexError('step %d out of the %d steps' % (step, self.length))
+        value = self.memo.get(step)
+        if value is None:
+            value = self.memo[step] = self.function(step)
+        return value
+
+    def __iter__(self):
+        return (self[step] for step in range(self.length))
+
+
+class Motion:
+    '''Motion descriptors, usable in the json in place of a Move list :
+    {"Motion": "static"} stays on its starting cell,
+    {"Motion": "patrol", "To": [x, y]} goes back and forth on the row or column between its start and To,
+    {"Motion": "cycle", "Path": [[x, y], ...]} goes through the cells of Path then back to its start, again and again,
+    {"Motion": "waypoints", "Waypoints": [[x, y], ...]} walks a cell per step to every waypoint, horizontally first,
+    then back to its start, again and again.
+    An optional "Offset" advances the motion by that many steps. The cell of a step is computed directly from
+    the descriptor, so a mover needs no list whatever the number of steps'''
+    KINDS = ('static', 'patrol', 'cycle', 'waypoints')
+
+    @classmethod
+    def Track(cls, descriptor, start, length, width, Cell) -> Track:
+        '''Returns the Track of length steps of the descriptor, for a cell starting on the start cell.
+        Cell converts the pixel coordinates of the descriptor to cell indexes'''
+        kind = descriptor.get('Motion')
+        if kind not in cls.KINDS:
+            raise ValueError('unknown motion %r' % (kind,))
+        offset = descriptor.get('Offset', 0) + 1 # the first step of a Move list is after one move
+        Position = getattr(cls, kind.capitalize())(descriptor, start, width, Cell)
+        return Track(lambda step: Position(step + offset), length)
+
+    @staticmethod
+    def Static(descriptor, start, width, Cell):
+        return lambda moves: start
+
+    @staticmethod
+    def Patrol(descriptor, start, width, Cell):
+        end = Cell(descriptor['To'])
+        distance = abs(end % width - start % width) + abs(end // width - start // width)
+        if distance == 0:
+            return lambda moves: start
+        delta = (end - start) // distance # +-1 on a row, +-width on a column
+
+        def Position(moves):
+            moves %= 2*distance
+            return start + delta * (moves if moves <= distance else 2*distance - moves)
+        return Position
+
+    @staticmethod
+    def Cycle(descriptor, start, width, Cell):
+        cells = tuple(Cell(coo) for coo in descriptor['Path']) + (start,)
+        return lambda moves: cells[(moves - 1) % len(cells)]
+
+    @staticmethod
+    def Waypoints(descriptor, start, width, Cell):
+        corners = [divmod(start, width)] + [divmod(Cell(coo), width) for coo in descriptor['Waypoints']]
+        # Moves done at the beginning of each segment, the last one being the length of a whole loop
+        firsts = [0]
+        for (row, column), (next_row, next_column) in zip(corners, corners[1:] + corners[:1]):
+            firsts.append(firsts[-1] + abs(next_column - column) + abs(next_row - row))
+        if firsts[-1] == 0:
+            return lambda moves: start
+
+        def Position(moves):
+            moves %= firsts[-1]
+            segment = bisect.bisect_right(firsts, moves) - 1
+            (row, column), (next_row, next_column) = corners[segment], corners[(segment + 1) % len(corners)]
+            moves -= firsts[segment]
+            columns = abs(next_column - column)
+            if moves <= columns:
+                return row*width + column + (moves if next_column > column else -moves)
+            moves -= columns
+            return (row + (moves if next_row > row else -moves))*width + next_column
+        return Position
+
+
+class Level:
+    '''Immutable compact version of a level json file,
+    every coordinate is stored as a cell index (row * width + column) inside tuples.
+    The bitmasks of the victory and red cells of every step are computed once here,
+    or on the first read of each step when a cell moves by a Motion descriptor'''
+    __slots__ = ('name', 'width', 'height', 'cell_size', 'move_limit',
+                 'player_start', 'victory_start', 'red_starts',
+                 'victory_move', 'red_move', 'arrows',
+                 'victory_masks', 'red_masks')
+
+    # Optional json fields of the board, with the values used when they are missing
+    DEFAULTS = {'Board_Width': 10, 'Board_Height': 5, 'Cell_Size': 75, 'Move_Limit': 15}
+
+    def __init__(self, name, width, height, cell_size, move_limit, player_start, victory_start, red_starts, victory_move, red_move, arrows):
+        '''Stores the level data, object.__setattr__ is needed since __setattr__ is locked'''
+        if isinstance(victory_move, tuple) and all(isinstance(red_cell, tuple) for red_cell in red_move):
+            victory_masks = tuple(1 << cell for cell in victory_move)
+            red_masks = tuple(self.Mask(cells, width*height) for cells in zip(*red_move)) if red_move else (0,) * len(victory_move)
+        else:
+            victory_masks = Track(lambda step: 1 << victory_move[step], len(victory_move))
+            if red_move:
+                red_masks = Track(lambda step: self.Mask([red_cell[step] for red_cell in red_move], width*height),
+                                  min(len(red_cell) for red_cell in red_move))
+            else:
+                red_masks = (0,) * len(victory_move)
+
+        for attribute, value in (('name', name), ('width', width), ('height', height), ('cell_size', cell_size), ('move_limit', move_limit),
+                                 ('player_start', player_start), ('victory_start', victory_start), ('red_starts', red_starts),
+                                 ('victory_move', victory_move), ('red_move', red_move), ('arrows', arrows),
+                                 ('victory_masks', victory_masks),
+                                 ('red_masks', red_masks)):
+            object.__setattr__(self, attribute, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Level objects are immutable')
+
+    @staticmethod
+    def Mask(cells, size) -> int:
+        '''Returns the bitmask of the given cells, built in a bytearray so big boards don't copy
+        a whole integer for every cell'''
+        bits = bytearray((size + 7) // 8)
+        for cell in cells:
+            bits[cell >> 3] |= 1 << (cell & 7)
+        return int.from_bytes(bits, 'little')
+
+    @classmethod
+    def Board(cls, lv_data) -> tuple:
+        '''Returns the width, height, cell size and move limit of the level json data'''
+        return tuple(lv_data.get(key, default) for key, default in cls.DEFAULTS.items())
+
+    @classmethod
+    def FromJson(cls, name, lv_data):
+        '''Creates the Level from the dictionary loaded from its json file'''
+        width, height, cell_size, move_limit = cls.Board(lv_data)
+
+        def Cell(coo) -> int:
+            return (coo[1]//cell_size)*width + coo[0]//cell_size
+
+        def Move(move, start):
+            # A Motion descriptor lasts the move limit, a Move list its own length
+            if isinstance(move, dict):
+                return Motion.Track(move, start, move_limit, width, Cell)
+            return tuple(Cell(coo) for coo in move)
+
+        victory_start = Cell(lv_data['Victory_Cell_Starting_Coo'])
+        red_starts = tuple(Cell(coo) for coo in lv_data['Red_Cells_Starter_Coo'])
+        return cls(name, width, height, cell_size, move_limit,
+                   Cell(lv_data['Player_Starter_Coo']),
+                   victory_start,
+                   red_starts,
+                   Move(lv_data['Victory_Cell_Move'], victory_start),
+                   tuple(Move(red_cell, red_start) for red_cell, red_start in zip(lv_data['Red_Cells_Move'], red_starts)),
+                   tuple(tuple(arrow) for arrow in lv_data['Arrow']))
+
+    @classmethod
+    def Validate(cls, lv_data) -> list:
+        '''Returns the list of the schema errors of the level json data, empty if the level is valid'''
+        if not isinstance(lv_data, dict):
+            return ['the level is not a json object']
+
+        errors = []
+        for key in ('Player_Starter_Coo', 'Victory_Cell_Starting_Coo', 'Victory_Cell_Move',
+                    'Red_Cells_Starter_Coo', 'Red_Cells_Move', 'Arrow'):
+            if key not in lv_data:
+                errors.append('missing ' + key)
+        for key in cls.DEFAULTS:
+            if key in lv_data and not (type(lv_data[key]) is int and lv_data[key] > 0):
+                errors.append('%s : %r is not a positive integer' % (key, lv_data[key]))
+        if errors:
+            return errors
+        width, height, cell_size, move_limit = cls.Board(lv_data)
+
+        def CheckCoo(coo, where):
+            if not (isinstance(coo, list) and len(coo) == 2 and all(type(value) is int for value in coo)):
+                errors.append('%s : %r is not a pair of integers' % (where, coo))
+            elif coo[0] % cell_size or coo[1] % cell_size:
+                errors.append('%s : %r is not aligned on the %d pixel cells' % (where, coo, cell_size))
+            elif not (0 <= coo[0] < width*cell_size and 0 <= coo[1] < height*cell_size):
+                errors.append('%s : %r is outside of the board' % (where, coo))
+
+        def CheckMotion(motion, where, start):
+            kind = motion.get('Motion')
+            if kind not in Motion.KINDS:
+                errors.append('%s : unknown motion %r' % (where, kind))
+                return
+            if 'Offset' in motion and not (type(motion['Offset']) is int and motion['Offset'] >= 0):
+                errors.append('%s.Offset : %r is not a positive integer' % (where, motion['Offset']))
+            if kind == 'patrol':
+                count = len(errors)
+                CheckCoo(motion.get('To'), where + '.To')
+                if (len(errors) == count and isinstance(start, list) and len(start) == 2
+                        and motion['To'][0] != start[0] and motion['To'][1] != start[1]):
+                    errors.append('%s.To : %r is not on the row or the column of %r' % (where, motion['To'], start))
+            elif kind in ('cycle', 'waypoints'):
+                key = {'cycle': 'Path', 'waypoints': 'Waypoints'}[kind]
+                cells = motion.get(key)
+                if not (isinstance(cells, list) and cells):
+                    errors.append('%s.%s is not a list of coordinates' % (where, key))
+                    return
+                for i, coo in enumerate(cells):
+                    CheckCoo(coo, '%s.%s[%d]' % (where, key, i))
+
+        def CheckMove(move, where, start=None):
+            if isinstance(move, dict):
+                CheckMotion(move, where, start)
+                return
+            if not isinstance(move, list):
+                errors.append('%s is not a list or a motion' % where)
+                return
+            # Exactly the move limit, the first move reads the last step of every list
+            if len(move) != move_limit:
+                errors.append('%s has %d steps, %d expected' % (where, len(move), move_limit))
+            for step, coo in enumerate(move):
+                CheckCoo(coo, '%s[%d]' % (where, step))
+
+        CheckCoo(lv_data['Player_Starter_Coo'], 'Player_Starter_Coo')
+        CheckCoo(lv_data['Victory_Cell_Starting_Coo'], 'Victory_Cell_Starting_Coo')
+        CheckMove(lv_data['Victory_Cell_Move'], 'Victory_Cell_Move', lv_data['Victory_Cell_Starting_Coo'])
+
+        if not isinstance(lv_data['Red_Cells_Starter_Coo'], list) or not isinstance(lv_data['Red_Cells_Move'], list):
+            errors.append('Red_Cells_Starter_Coo and Red_Cells_Move must be lists')
+        else:
+            for i, coo in enumerate(lv_data['Red_Cells_Starter_Coo']):
+                CheckCoo(coo, 'Red_Cells_Starter_Coo[%d]' % i)
+            starts = lv_data['Red_Cells_Starter_Coo']
+            for i, move in enumerate(lv_data['Red_Cells_Move']):
+                CheckMove(move, 'Red_Cells_Move[%d]' % i, starts[i] if i < len(starts) else None)
+            if len(lv_data['Red_Cells_Starter_Coo']) != len(lv_data['Red_Cells_Move']):
+                errors.append('%d red cells in Red_Cells_Starter_Coo but %d in Red_Cells_Move'
+                              % (len(lv_data['Red_Cells_Starter_Coo']), len(lv_data['Red_Cells_Move'])))
+
+        if not isinstance(lv_data['Arrow'], list):
+            errors.append('Arrow is not a list')
+        else:
+            for i, arrow in enumerate(lv_data['Arrow']):
+                if not (isinstance(arrow, list) and len(arrow) in (4, 5)
+                        and type(arrow[0]) is int and type(arrow[1]) is int
+                        and all(isinstance(text, str) for text in arrow[2:])):
+                    errors.append('Arrow[%d] : %r is not [column, row, text, colour(, side)]' % (i, arrow))
+                elif len(arrow) == 5 and arrow[4] not in ('left', 'right', 'up', 'down'):
+                    errors.append('Arrow[%d] : unknown side %r' % (i, arrow[4]))
+
+        return errors
+
+    def Cell(self, coo) -> int:
+        '''Converts pixel coordinates to a cell index'''
+        return (coo[1]//self.cell_size)*self.width + coo[0]//self.cell_size
+
+    def Coo(self, cell) -> tuple:
+        '''Converts a cell index to the pixel coordinates of its top left corner'''
+        row, column = divmod(cell, self.width)
+        return (column*self.cell_size, row*self.cell_size)
+
+
+class LevelRepository:
+    '''Parses each level file once and keeps the resulting Level objects.
+    An entry is parsed again only when the modification time of its file changed
+    and the hash of its content changed too'''
+    def __init__(self, folder_path):
+        '''Stores the folder path and creates the cache and its counters'''
+        self.folder_path = folder_path
+        self.entries = {} # level name -> (modification stamp, content hash, Level)
+
+        self.hits = 0
+        self.misses = 0
+        self.load_time = 0.0
+
+    def Get(self, name) -> Level:
+        '''Returns the Level of the given name, parsing its file only if needed'''
+        path = os.path.join(self.folder_path, name + '.json')
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self.entries.get(name)
+        if entry is not None and entry[0] == stamp:
+            self.hits += 1
+            return entry[2]
+
+        start = time.perf_counter()
+        with open(path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+
+        # File touched without its content being changed
+        if entry is not None and entry[1] == digest:
+            self.entries[name] = (stamp, digest, entry[2])
+            self.hits += 1
+            return entry[2]
+
+        level = Level.FromJson(name, json.loads(raw))
+        self.entries[name] = (stamp, digest, level)
+        self.misses += 1
+        self.load_time += time.perf_counter() - start
+        return level
+
+    def Invalidate(self, name=None):
+        '''Forgets the given level, or every level if no name is given'''
+        if name is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(name, None)
+
+    def Stats(self) -> dict:
+        '''Returns the counters of the repository'''
+        return {'levels': len(self.entries), 'hits': self.hits, 'misses': self.misses, 'load_time': self.load_time}
+
+class LevelCatalog:
+    '''Natural sorted index of the level files of a folder ("Level 2" before "Level 10").
+    The folder is only listed again when its modification time changed, which happens when a file is added, removed or renamed'''
+    def __init__(self, folder_path):
+        '''Stores the folder path, the index is built by the first call'''
+        self.folder_path = folder_path
+        self.stamp = None
+        self.names = []
+        self.scans = 0
+
+    @staticmethod
+    def NaturalKey(name) -> list:
+        '''Sort key comparing the numbers inside the names by value'''
+        return [int(part) if part.isdigit() else part.casefold() for part in re.split(r'(\d+)', name)]
+
+    def Names(self) -> list:
+        '''Returns the sorted level names, listing the folder only if it changed'''
+        stamp = os.stat(self.folder_path).st_mtime_ns
+        if stamp != self.stamp:
+            with os.scandir(self.folder_path) as entries:
+                names = [entry.name[:-5] for entry in entries if entry.name.endswith('.json')]
+            self.names = sorted(names, key=self.NaturalKey)
+            self.stamp = stamp
+            self.scans += 1
+        return self.names
+
+    def PageCount(self, size) -> int:
+        return max(1, -(-len(self.Names()) // size))
+
+    def Page(self, page, size) -> list:
+        '''Returns the names of the given page of size levels'''
+        return self.Names()[page*size:(page+1)*size]
+
+
+class LevelPack:
+    '''Binary pack storing many levels in one file, opened with mmap so a single level
+    is decoded without reading the rest of the pack.
+
+    Layout : header | level records | offset index (count+1 uint64) | level names
+    A record starts with the level name, so reading a level by index never touches the names.
+    It stores the board fields present in the json, then each position as a varint cell index (one byte on the 10x5 board),
+    and each Move list with the shortest of the static, periodic, run-length or raw encodings.
+    Json keys outside the level schema are carried through as json text, so unpacking gives back the same data.
+    A Motion descriptor is kept as its json text, it is already shorter than any expanded list'''
+    MAGIC = b'OMPK'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHIQQ') # magic, version, level count, index position, names position
+
+    # Move list encodings
+    STATIC, PERIODIC, RUNS, RAW, MOTION = range(5)
+
+    # Json keys with a dedicated encoding, any other key is kept in a json text at the end of the record
+    FIELDS = ('Identity', *Level.DEFAULTS, 'Player_Starter_Coo', 'Victory_Cell_Starting_Coo', 'Victory_Cell_Move',
+              'Red_Cells_Starter_Coo', 'Red_Cells_Move', 'Arrow')
+    EXTRA_FLAG = 2 << len(Level.DEFAULTS)
+
+    def __init__(self, path):
+        '''Maps the pack file in memory and reads its header'''
+        self.path = path
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.count, self.index_pos, self.names_pos = self.HEADER.unpack_from(self.map, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(path + ' is not a level pack')
+
+        self.names = None
+        self.name_index = None
+
+    def __len__(self):
+        return self.count
+
+    def Close(self):
+        self.map.close()
+
+    @property
+    def Names(self) -> list:
+        '''Returns the names of the levels in pack order, decoded on first access'''
+        if self.names is None:
+            self.names = []
+            pos = self.names_pos
+            for _ in range(self.count):
+                length, pos = self.ReadVarint(self.map, pos)
+                self.names.append(self.map[pos:pos+length].decode('utf-8'))
+                pos += length
+            self.name_index = {name: i for i, name in enumerate(self.names)}
+        return self.names
+
+    def Record(self, key) -> bytes:
+        '''Returns the bytes of a level record from its index or its name'''
+        if isinstance(key, str):
+            self.Names
+            key = self.name_index[key]
+        if not 0 <= key < self.count:
+            raise IndexError('level index out of range')
+
+        start, end = struct.unpack_from('<QQ', self.map, self.index_pos + 8*key)
+        return self.map[start:end]
+
+    def GetJson(self, key) -> dict:
+        '''Returns the level in the json schema of the Level_Folder files'''
+        return self.DecodeLevel(self.Record(key))[1]
+
+    def Get(self, key) -> Level:
+        '''Returns the level as a Level object'''
+        return Level.FromJson(*self.DecodeLevel(self.Record(key)))
+
+    def ToFolder(self, folder_path):
+        '''Writes back every level of the pack as a json file'''
+        for i, name in enumerate(self.Names):
+            with open(os.path.join(folder_path, name + '.json'), 'w', encoding='utf-8') as f:
+                json.dump(self.GetJson(i), f, ensure_ascii=False)
+
+    @classmethod
+    def FromFolder(cls, folder_path, pack_path):
+        '''Writes a pack holding every json level of the folder, in the natural order of the LevelCatalog'''
+        def Levels():
+            for name in LevelCatalog(folder_path).Names():
+                with open(os.path.join(folder_path, name + '.json'), 'r', encoding='utf-8') as f:
+                    yield name, json.load(f)
+
+        cls.Write(pack_path, Levels())
+
+    @classmethod
+    def Write(cls, pack_path, levels):
+        '''Writes the pack from an iterable of (name, level json data),
+        records are streamed to the file so only the index stays in memory'''
+        offsets = array('Q')
+        names = bytearray()
+
+        with open(pack_path, 'wb') as f:
+            f.write(bytes(cls.HEADER.size))
+            for name, lv_data in levels:
+                offsets.append(f.tell())
+                f.write(cls.EncodeLevel(name, lv_data))
+                names += cls.String(name)
+            offsets.append(f.tell())
+
+            index_pos = f.tell()
+            f.write(struct.pack('<%dQ' % len(offsets), *offsets))
+            names_pos = f.tell()
+            f.write(names)
+
+            f.seek(0)
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(offsets)-1, index_pos, names_pos))
+
+    ### Encoding ###
+
+    @staticmethod
+    def Varint(value) -> bytes:
+        '''Encodes a positive integer on as few bytes as possible, 7 bits per byte'''
+        if 0 <= value < 0x80:
+            return bytes((value,))
+        if value < 0:
+            raise ValueError('negative values can not be packed')
+        out = bytearray()
+        while value >= 0x80:
+            out.append(value & 0x7F | 0x80)
+            value >>= 7
+        out.append(value)
+        return bytes(out)
+
+    @staticmethod
+    def ReadVarint(data, pos) -> tuple:
+        '''Decodes the varint starting at pos, returns the value and the position after it'''
+        value = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, pos
+            shift += 7
+
+    @classmethod
+    def String(cls, text) -> bytes:
+        encoded = text.encode('utf-8')
+        return cls.Varint(len(encoded)) + encoded
+
+    @staticmethod
+    def CellIndex(coo, board) -> int:
+        '''Converts pixel coordinates to a cell index of the (width, height, cell size) board,
+        refusing coordinates that would not come back identical'''
+        width, height, cell_size = board
+        x, y = coo
+        if not (type(x) is int and type(y) is int and x % cell_size == 0 and y % cell_size == 0
+                and 0 <= x < width*cell_size and 0 <= y < height*cell_size):
+            raise ValueError('coordinates %s are not on a cell of the board' % (coo,))
+        return (y//cell_size)*width + x//cell_size
+
+    @classmethod
+    def EncodeCell(cls, coo, board) -> bytes:
+        return cls.Varint(cls.CellIndex(coo, board))
+
+    @classmethod
+    def EncodeMove(cls, move, board) -> bytes:
+        '''Encodes a Move list of coordinates with the shortest encoding'''
+        if isinstance(move, dict):
+            return bytes([cls.MOTION]) + cls.String(json.dumps(move, separators=(',', ':')))
+        cells = [cls.CellIndex(coo, board) for coo in move]
+        header = cls.Varint(len(cells))
+
+        if len(set(cells)) <= 1:
+            return bytes([cls.STATIC]) + header + b''.join(map(cls.Varint, cells[:1]))
+
+        candidates = [bytes([cls.RAW]) + header + b''.join(map(cls.Varint, cells))]
+
+        runs = []
+        for cell in cells:
+            if runs and runs[-1][1] == cell:
+                runs[-1][0] += 1
+            else:
+                runs.append([1, cell])
+        if len(runs) < len(cells) // 2:
+            candidates.append(bytes([cls.RUNS]) + cls.Varint(len(runs)) + b''.join(cls.Varint(length) + cls.Varint(cell) for length, cell in runs))
+
+        for period in range(2, len(cells)):
+            if cells[period:] == cells[:-period]:
+                candidates.append(bytes([cls.PERIODIC]) + header + cls.Varint(period) + b''.join(map(cls.Varint, cells[:period])))
+                break
+
+        return min(candidates, key=len)
+
+    @classmethod
+    def EncodeLevel(cls, name, lv_data) -> bytes:
+        '''Encodes the name and json data of a level to a pack record'''
+        out = bytearray(cls.String(name))
+
+        # Flags : bit 0 for the Identity, then one bit per board field present in the json, then one for the other keys
+        flags = 1 if 'Identity' in lv_data else 0
+        for i, key in enumerate(Level.DEFAULTS):
+            if key in lv_data:
+                flags |= 2 << i
+        extra = {key: value for key, value in lv_data.items() if key not in cls.FIELDS}
+        if extra:
+            flags |= cls.EXTRA_FLAG
+        out += cls.Varint(flags)
+        if 'Identity' in lv_data:
+            out += cls.String(lv_data['Identity'])
+        for key in Level.DEFAULTS:
+            if key in lv_data:
+                out += cls.Varint(lv_data[key])
+
+        board = Level.Board(lv_data)[:3]
+        out += cls.EncodeCell(lv_data['Player_Starter_Coo'], board)
+        out += cls.EncodeCell(lv_data['Victory_Cell_Starting_Coo'], board)
+        out += cls.EncodeMove(lv_data['Victory_Cell_Move'], board)
+
+        out += cls.Varint(len(lv_data['Red_Cells_Starter_Coo']))
+        for coo in lv_data['Red_Cells_Starter_Coo']:
+            out += cls.EncodeCell(coo, board)
+        out += cls.Varint(len(lv_data['Red_Cells_Move']))
+        for move in lv_data['Red_Cells_Move']:
+            out += cls.EncodeMove(move, board)
+
+        # Arrow texts and colours are few and repeated, they are stored once in a table
+        strings = []
+        for arrow in lv_data['Arrow']:
+            for text in arrow[2:]:
+                if text not in strings:
+                    strings.append(text)
+        out += cls.Varint(len(strings))
+        for text in strings:
+            out += cls.String(text)
+
+        out += cls.Varint(len(lv_data['Arrow']))
+        for arrow in lv_data['Arrow']:
+            if type(arrow[0]) is not int or type(arrow[1]) is not int:
+                raise ValueError('arrow coordinates %s are not cell numbers' % (arrow[:2],))
+            out += cls.Varint(len(arrow)) + cls.Varint(arrow[0]) + cls.Varint(arrow[1])
+            for text in arrow[2:]:
+                out += cls.Varint(strings.index(text))
+
+        if extra:
+            out += cls.String(json.dumps(extra, ensure_ascii=False, separators=(',', ':')))
+        return bytes(out)
+
+    ### Decoding ###
+
+    @classmethod
+    def DecodeCell(cls, data, pos, board) -> tuple:
+        width, height, cell_size = board
+        cell, pos = cls.ReadVarint(data, pos)
+        row, column = divmod(cell, width)
+        return [column*cell_size, row*cell_size], pos
+
+    @classmethod
+    def DecodeMove(cls, data, pos, board) -> tuple:
+        mode = data[pos]
+        pos += 1
+
+        if mode == cls.RUNS:
+            run_count, pos = cls.ReadVarint(data, pos)
+            move = []
+            for _ in range(run_count):
+                length, pos = cls.ReadVarint(data, pos)
+                coo, pos = cls.DecodeCell(data, pos, board)
+                move += [list(coo) for _ in range(length)]
+            return move, pos
+
+        if mode == cls.MOTION:
+            text, pos = cls.ReadString(data, pos)
+            return json.loads(text), pos
+
+        length, pos = cls.ReadVarint(data, pos)
+        if mode == cls.STATIC:
+            if length == 0:
+                return [], pos
+            coo, pos = cls.DecodeCell(data, pos, board)
+            return [list(coo) for _ in range(length)], pos
+
+        if mode == cls.PERIODIC:
+            period, pos = cls.ReadVarint(data, pos)
+        else:
+            period = length
+        cycle = []
+        for _ in range(period):
+            coo, pos = cls.DecodeCell(data, pos, board)
+            cycle.append(coo)
+        return [list(cycle[i % period]) for i in range(length)], pos
+
+    @classmethod
+    def ReadString(cls, data, pos) -> tuple:
+        length, pos = cls.ReadVarint(data, pos)
+        return bytes(data[pos:pos+length]).decode('utf-8'), pos + length
+
+    @classmethod
+    def DecodeLevel(cls, data) -> tuple:
+        '''Decodes a pack record to the name and the json data of the level'''
+        lv_data = {}
+        name, pos = cls.ReadString(data, 0)
+        flags, pos = cls.ReadVarint(data, pos)
+        if flags & 1:
+            lv_data['Identity'], pos = cls.ReadString(data, pos)
+        for i, key in enumerate(Level.DEFAULTS):
+            if flags & 2 << i:
+                lv_data[key], pos = cls.ReadVarint(data, pos)
+
+        board = Level.Board(lv_data)[:3]
+        lv_data['Player_Starter_Coo'], pos = cls.DecodeCell(data, pos, board)
+        lv_data['Victory_Cell_Starting_Coo'], pos = cls.DecodeCell(data, pos, board)
+        lv_data['Victory_Cell_Move'], pos = cls.DecodeMove(data, pos, board)
+
+        count, pos = cls.ReadVarint(data, pos)
+        lv_data['Red_Cells_Starter_Coo'] = []
+        for _ in range(count):
+            coo, pos = cls.DecodeCell(data, pos, board)
+            lv_data['Red_Cells_Starter_Coo'].append(coo)
+
+        count, pos = cls.ReadVarint(data, pos)
+        lv_data['Red_Cells_Move'] = []
+        for _ in range(count):
+            move, pos = cls.DecodeMove(data, pos, board)
+            lv_data['Red_Cells_Move'].append(move)
+
+        count, pos = cls.ReadVarint(data, pos)
+        strings = []
+        for _ in range(count):
+            text, pos = cls.ReadString(data, pos)
+            strings.append(text)
+
+        count, pos = cls.ReadVarint(data, pos)
+        lv_data['Arrow'] = []
+        for _ in range(count):
+            length, pos = cls.ReadVarint(data, pos)
+            x, pos = cls.ReadVarint(data, pos)
+            y, pos = cls.ReadVarint(data, pos)
+            arrow = [x, y]
+            for _ in range(length-2):
+                index, pos = cls.ReadVarint(data, pos)
+                arrow.append(strings[index])
+            lv_data['Arrow'].append(arrow)
+
+        if flags & cls.EXTRA_FLAG:
+            text, pos = cls.ReadString(data, pos)
+            lv_data.update(json.loads(text))
+        return name, lv_data
+
+
+class AttemptLog:
+    '''Append-only binary log of the runs played, written through a buffer so logging never waits for the disk.
+
+    Layout : MAGIC then records starting with their type byte
+    SESSION : start time in milliseconds (uint64), resets the level name table
+    LEVEL : level name, taking the next level id of the session
+    ATTEMPT : level id, milliseconds since the session start, move count (varints),
+              the moves packed on 2 bits, outcome | phase << 2 (byte), step of the end of the run (varint)'''
+    MAGIC = b'OMAL'
+    SESSION, LEVEL, ATTEMPT = range(3)
+    FILE_NAME = 'Attempt_Log.bin'
+    CODES = {'Up': 0, 'Down': 1, 'Left': 2, 'Right': 3} # Codes of the BatchVerifier, the indexes of Solver.MOVES
+
+    def __init__(self, path, buffer_size=65536):
+        '''The file is only created by the first flush'''
+        self.path = path
+        self.buffer_size = buffer_size
+        self.buffer = bytearray()
+        self.session_start = None
+        self.levels = {} # level name -> level id of the session
+
+    def Add(self, level_name, moves, outcome, step, phase, timestamp=None):
+        '''Logs a run, as returned by Simulator.Run'''
+        now = round((time.time() if timestamp is None else timestamp) * 1000)
+        if self.session_start is None:
+            self.session_start = now
+            self.buffer.append(self.SESSION)
+            self.buffer += struct.pack('<Q', now)
+        if level_name not in self.levels:
+            self.levels[level_name] = len(self.levels)
+            self.buffer.append(self.LEVEL)
+            self.buffer += LevelPack.String(level_name)
+
+        self.buffer.append(self.ATTEMPT)
+        self.buffer += LevelPack.Varint(self.levels[level_name])
+        self.buffer += LevelPack.Varint(max(0, now - self.session_start))
+        self.buffer += LevelPack.Varint(len(moves))
+        self.buffer += self.PackMoves(moves)
+        self.buffer.append(outcome | phase << 2)
+        self.buffer += LevelPack.Varint(step)
+
+        if len(self.buffer) >= self.buffer_size:
+            self.Flush()
+
+    def Flush(self):
+        '''Appends the buffered records to the file'''
+        if not self.buffer:
+            return
+        with open(self.path, 'ab') as f:
+            if f.tell() == 0:
+                f.write(self.MAGIC)
+            f.write(self.buffer)
+        self.buffer.clear()
+
+    @staticmethod
+    def PackMoves(moves) -> bytes:
+        '''Packs 4 moves per byte, 2 bits per move code'''
+        packed = bytearray((len(moves) + 3) // 4)
+        for i, move in enumerate(moves):
+            packed[i >> 2] |= AttemptLog.CODES[move] << ((i & 3) * 2)
+        return bytes(packed)
+
+    @staticmethod
+    def UnpackMoves(packed, count) -> list:
+        '''Returns the moves of a packed pile'''
+        return [Solver.MOVES[packed[i >> 2] >> ((i & 3) * 2) & 3] for i in range(count)]
+
+    @classmethod
+    def Read(cls, path):
+        '''Streams the attempts of the log as (level name, packed moves, move count, outcome, step, phase, timestamp) tuples,
+        UnpackMoves giving back the moves. A record cut by a crash ends the stream'''
+        ReadVarint = LevelPack.ReadVarint
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size <= len(cls.MAGIC):
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if data[:len(cls.MAGIC)] != cls.MAGIC:
+                    raise ValueError(path + ' is not an attempt log')
+                pos = len(cls.MAGIC)
+                end = len(data)
+                names = []
+                session_start = 0
+                try:
+                    while pos < end:
+                        kind = data[pos]
+                        if kind == cls.ATTEMPT:
+                            # The level id and the move count are read inline when they fit a byte, as they nearly always do
+                            level_id = data[pos+1]
+                            pos += 2
+                            if level_id >= 0x80:
+                                level_id, pos = ReadVarint(data, pos-1)
+                            elapsed, pos = ReadVarint(data, pos)
+                            count = data[pos]
+                            pos += 1
+                            if count >= 0x80:
+                                count, pos = ReadVarint(data, pos-1)
+                            size = (count+3) >> 2
+                            packed = data[pos:pos+size]
+                            result = data[pos+size]
+                            step, pos = ReadVarint(data, pos+size+1)
+                            if pos > end:
+                                return
+                            yield (names[level_id], packed, count, result & 3, step, result >> 2, (session_start + elapsed) / 1000)
+                        elif kind == cls.LEVEL:
+                            name, pos = LevelPack.ReadString(data, pos+1)
+                            names.append(name)
+                        elif kind == cls.SESSION:
+                            session_start = struct.unpack_from('<Q', data, pos+1)[0]
+                            pos += 9
+                            names = []
+                        else:
+                            raise ValueError('unknown record type %d in %s' % (kind, path))
+                except (IndexError, struct.error):
+                    return # The last record was not entirely written
+
+
+################################################################################
+
+class SolveResult:
+    '''Result of a Solver search.
+    path is the shortest list of moves reaching the Victory Cell, None if the level can't be solved.
+    frontiers holds the bitmask of the cells the player can stand on before each move,
+    an unsolvable result is proven by these frontiers never touching the Victory Cell.
+    The results given by the SolutionCache have no frontiers'''
+    __slots__ = ('path', 'frontiers')
+
+    def __init__(self, path, frontiers):
+        self.path = path
+        self.frontiers = frontiers
+
+    @property
+    def solvable(self) -> bool:
+        return self.path is not None
+
+
+class Solver:
+    '''Breadth-first solver encoding the board as integer bitmasks, one bit per cell.
+    Every cell reachable after a given amount of moves is expanded at once with bit shifts,
+    the first step touching the Victory Cell gives the shortest solution'''
+
+    # Checking order used when rebuilding the path, keeps the solution deterministic
+    MOVES = ('Up', 'Down', 'Left', 'Right')
+
+    def __init__(self):
+        '''Creates the cache of the board masks'''
+        self.boards = {} # (width, height) -> (full mask, not left column mask, not right column mask)
+
+    def SetBoard(self, width, height):
+        '''Selects the board dimensions and the masks used to prevent
+        a horizontal shift from wrapping the player to the other side of the board'''
+        if (width, height) not in self.boards:
+            full_mask = (1 << (width*height)) - 1
+            left_column = Level.Mask(range(0, width*height, width), width*height)
+            self.boards[(width, height)] = (full_mask, full_mask & ~left_column, full_mask & ~(left_column << (width-1)))
+
+        self.width = width
+        self.full_mask, self.not_left_column, self.not_right_column = self.boards[(width, height)]
+
+    def Shift(self, frontier, move) -> int:
+        '''Moves every cell of the frontier in the given direction,
+        cells leaving the board are dropped'''
+        match move:
+            case 'Up':
+                return frontier >> self.width
+            case 'Down':
+                return (frontier << self.width) & self.full_mask
+            case 'Left':
+                return (frontier & self.not_left_column) >> 1
+            case 'Right':
+                return (frontier & self.not_right_column) << 1
+
+    def Solve(self, level, progress=None) -> SolveResult:
+        '''Expands the reachable cells one step at a time following the LevelOperator rules :
+        after a move the player is checked against the cells of the previous step,
+        then against the cells of the current step once they moved.
+        progress is called after each step with the depth reached and the states explored so far,
+        returning True stops the search and Solve returns None'''
+        self.SetBoard(level.width, level.height)
+        victory_masks, red_masks = level.victory_masks, level.red_masks
+        frontiers = [1 << level.player_start]
+        states = 1
+
+        for step in range(min(level.move_limit, len(victory_masks))):
+            # Negative indexes wrap around like the victory_cell_coo[self.step-1] of LevelOperator
+            victory_before, red_before = victory_masks[step-1], red_masks[step-1]
+            victory_after, red_after = victory_masks[step], red_masks[step]
+
+            survivors = 0
+            for move in self.MOVES:
+                landing = self.Shift(frontiers[step], move)
+                if landing & victory_before:
+                    return SolveResult(self.Path(frontiers, step, move, landing & victory_before), frontiers)
+
+                landing &= ~red_before
+                if landing & victory_after:
+                    return SolveResult(self.Path(frontiers, step, move, landing & victory_after), frontiers)
+
+                survivors |= landing & ~red_after
+
+            if not survivors:
+                break
+            frontiers.append(survivors)
+
+            if progress is not None:
+                states += survivors.bit_count()
+                if progress(step+1, states):
+                    return None
+
+        return SolveResult(None, frontiers)
+
+    def Path(self, frontiers, step, move, victory_cell) -> list:
+        '''Rebuilds the path ending with the given move by walking the frontiers backward,
+        picking at each step the first move of MOVES coming from a reachable cell'''
+        path = [move]
+        cell = victory_cell
+        while step > 0:
+            cell = self.Shift(cell, self.Opposite(move))
+            step -= 1
+            for move in self.MOVES:
+                if self.Shift(cell, self.Opposite(move)) & frontiers[step]:
+                    break
+            path.append(move)
+
+        path.reverse()
+        return path
+
+    def Opposite(self, move) -> str:
+        return {'Up': 'Down', 'Down': 'Up', 'Left': 'Right', 'Right': 'Left'}[move]
+
+
+class SolveTask:
+    '''Runs a Solver search in a worker thread so the window keeps answering.
+    The progress counters, the result and the error are only written by the thread and read by polling them'''
+    def __init__(self, level):
+        '''Starts the search of the level'''
+        self.level = level
+        self.depth = 0
+        self.states = 0
+        self.result = None
+        self.error = None # exception raised by the search, result staying None
+        self.cancelled = threading.Event()
+
+        self.thread = threading.Thread(target=self.Run, daemon=True)
+        self.thread.start()
+
+    def Run(self):
+        try:
+            self.result = Solver().Solve(self.level, self.Progress)
+        except Exception as error:
+            self.error = error
+
+    def Progress(self, depth, states) -> bool:
+        '''Stores the progress of the search, asking it to stop once the task is cancelled'''
+        self.depth = depth
+        self.states = states
+        return self.cancelled.is_set()
+
+    def Cancel(self):
+        self.cancelled.set()
+
+    @property
+    def done(self) -> bool:
+        return not self.thread.is_alive()
+
+
+class SolutionCache:
+    '''On disk store of the Solver results, keyed by a hash of the movement data of the level
+    so renaming a level or editing its arrows keeps the solution.
+    The least recently used solutions are evicted past max_entries.
+    The last key of every level name is kept too, so an edited level removes the entry of its old version.
+    The file is only opened by the first lookup, and the lookups only read it : the use times of the hits
+    are written with the next Put or Flush'''
+    FILE_NAME = 'Solution_Cache.sqlite'
+    opened = {} # (path, max entries) -> SolutionCache of this process, used by WarmFile
+
+    def __init__(self, path, max_entries=10000):
+        '''Stores the path of the store, nothing is opened yet'''
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.keys = {} # id of a Level -> (Level, key), the Level being kept so its id is not reused
+        self.touched = {} # key -> time of the hits not written yet
+        self.connection = None
+
+    def Connect(self) -> sqlite3.Connection:
+        '''Returns the connection to the store, opening it and creating its tables on the first call.
+        Raises sqlite3.Error when the file can't be opened or written'''
+        if self.connection is not None:
+            return self.connection
+
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            # The write ahead log keeps the commits from waiting for the disk
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            with connection:
+                connection.execute('CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, path TEXT, used REAL)')
+                connection.execute('CREATE INDEX IF NOT EXISTS solutions_used ON solutions (used)')
+                connection.execute('CREATE TABLE IF NOT EXISTS names (name TEXT PRIMARY KEY, key TEXT)')
+        except sqlite3.Error:
+            connection.close()
+            raise
+        self.connection = connection
+        return connection
+
+    def Key(self, level) -> str:
+        '''Returns the hash of everything the Solver reads from the level,
+        computed once for each Level object since the Level objects are immutable'''
+        entry = self.keys.get(id(level))
+        if entry is not None:
+            return entry[1]
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(array('q', (level.width, level.height, level.move_limit, level.player_start, len(level.red_move))).tobytes())
+        digest.update(array('q', level.victory_move).tobytes())
+        for red_move in level.red_move:
+            digest.update(array('q', red_move).tobytes())
+
+        if len(self.keys) >= 1024:
+            self.keys.clear()
+        self.keys[id(level)] = (level, digest.hexdigest())
+        return self.keys[id(level)][1]
+
+    def Get(self, level):
+        '''Returns the cached SolveResult of the level, None if it was never solved'''
+        key = self.Key(level)
+        row = self.Connect().execute('SELECT path FROM solutions WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.touched[key] = time.time()
+        self.hits += 1
+        return SolveResult(json.loads(row[0]), None)
+
+    def WriteTouched(self, connection):
+        '''Writes the use times of the hits, inside the transaction of the caller'''
+        if self.touched:
+            connection.executemany('UPDATE solutions SET used = ? WHERE key = ?', [(used, key) for key, used in self.touched.items()])
+            self.touched.clear()
+
+    def Flush(self):
+        '''Writes the use times of the hits since the last Put or Flush'''
+        if self.touched:
+            with self.Connect() as connection:
+                self.WriteTouched(connection)
+
+    def Put(self, level, path):
+        '''Stores the solution path of the level, None for an unsolvable level'''
+        key = self.Key(level)
+        with self.Connect() as connection:
+            self.WriteTouched(connection)
+            if level.name:
+                row = connection.execute('SELECT key FROM names WHERE name = ?', (level.name,)).fetchone()
+                if row is not None and row[0] != key:
+                    # The level was edited, its old entry goes unless another level has the same movements
+                    connection.execute('DELETE FROM solutions WHERE key = ? AND NOT EXISTS '
+                                       '(SELECT 1 FROM names WHERE key = ? AND name != ?)', (row[0], row[0], level.name))
+                connection.execute('INSERT OR REPLACE INTO names VALUES (?, ?)', (level.name, key))
+
+            connection.execute('INSERT OR REPLACE INTO solutions VALUES (?, ?, ?)', (key, json.dumps(path), time.time()))
+            connection.execute('DELETE FROM solutions WHERE key IN '
+                               '(SELECT key FROM solutions ORDER BY used DESC LIMIT -1 OFFSET ?)', (self.max_entries,))
+
+    def Solve(self, level, solver=None) -> SolveResult:
+        '''Returns the cached result of the level, solving and storing it if needed.
+        Used by the tools, a hit is written at once'''
+        result = self.Get(level)
+        if result is None:
+            result = (solver or Solver()).Solve(level)
+            self.Put(level, result.path)
+        else:
+            self.Flush()
+        return result
+
+    def Warm(self, folder_path, jobs=None) -> dict:
+        '''Solves every valid level of the folder missing from the store, on all the cores.
+        The workers read, check and solve the files and fill the store themselves, only their counts come back'''
+        report = {'levels': 0, 'solved': 0}
+        function = functools.partial(SolutionCache.WarmFile, cache_path=self.path, max_entries=self.max_entries)
+        for solved in WorkerPool(jobs).Map(function, Validator.LevelPaths(folder_path)):
+            if solved is not None:
+                report['levels'] += 1
+                report['solved'] += solved
+        return report
+
+    @staticmethod
+    def WarmFile(path, cache_path, max_entries):
+        '''Solves and stores a level file missing from the store, used by Warm in the worker processes.
+        Returns whether the level was solved, None for an invalid file'''
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lv_data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if Level.Validate(lv_data):
+            return None
+
+        cache = SolutionCache.opened.get((cache_path, max_entries))
+        if cache is None:
+            cache = SolutionCache.opened[cache_path, max_entries] = SolutionCache(cache_path, max_entries)
+        misses = cache.misses
+        cache.Solve(Level.FromJson(os.path.basename(path)[:-5], lv_data))
+        return cache.misses > misses
+
+    def Stats(self) -> dict:
+        '''Returns the counters of the store'''
+        entries = self.Connect().execute('SELECT COUNT(*) FROM solutions').fetchone()[0]
+        return {'entries': entries, 'hits': self.hits, 'misses': self.misses}
+
+
+class HintTable:
+    '''Backward reachability table of a level, computed once when the level is loaded.
+    For every step it stores the bitset of the cells a move can land on and still win,
+    from which the cells still winnable before the move are deduced, so a hint costs a few bit tests'''
+    def __init__(self, level, solver=None):
+        '''Walks the steps backward with the shifts of the Solver, a landing cell wins when it is
+        the Victory Cell of the previous step, or it avoids the previous Red Cells and is the Victory Cell
+        of its own step or a cell still winnable at the next step avoiding its Red Cells'''
+        self.level = level
+        solver = solver or Solver()
+        solver.SetBoard(level.width, level.height)
+        victory_masks, red_masks = level.victory_masks, level.red_masks
+        length = min(level.move_limit, len(victory_masks))
+
+        landings = [0] * length
+        winnable = [0] * (length+1)
+        for step in range(length-1, -1, -1):
+            # Negative indexes wrap around like in the Solver
+            landings[step] = victory_masks[step-1] | (solver.full_mask & ~red_masks[step-1]
+                             & (victory_masks[step] | (winnable[step+1] & ~red_masks[step])))
+            for move in Solver.MOVES:
+                winnable[step] |= solver.Shift(landings[step], solver.Opposite(move))
+
+        # Stored as bytes so a bit test does not depend on the size of the board
+        size = (level.width*level.height + 7) // 8
+        self.landings = [mask.to_bytes(size, 'little') for mask in landings]
+        self.winnable = [mask.to_bytes(size, 'little') for mask in winnable]
+
+    @staticmethod
+    def Bit(bits, cell) -> bool:
+        return bits[cell >> 3] >> (cell & 7) & 1 == 1
+
+    def Winnable(self, step, cell) -> bool:
+        '''Tells if the level can still be won by the player standing on the cell before the move of the given step'''
+        return step < len(self.landings) and self.Bit(self.winnable[step], cell)
+
+    def NextMoves(self, step, cell) -> list:
+        '''Returns the moves of the given step keeping the level winnable, in the order of Solver.MOVES'''
+        if not self.Winnable(step, cell):
+            return []
+
+        y, x = divmod(cell, self.level.width)
+        moves = []
+        for move in Solver.MOVES:
+            dx, dy = Simulator.DELTAS[move]
+            if 0 <= x+dx < self.level.width and 0 <= y+dy < self.level.height \
+            and self.Bit(self.landings[step], (y+dy)*self.level.width + x+dx):
+                moves.append(move)
+        return moves
+
+
+################################################################################
+
+class Simulator:
+    '''Tk free implementation of the level rules, shared by LevelOperator and the tooling.
+    A move is first checked against the cells of the previous step (player phase),
+    then against the cells of its own step once they moved (cell phase)'''
+
+    # Outcomes, OUTCOMES gives their names
+    VICTORY, RED_CELL, OUT_OF_BOUNDS, OUT_OF_MOVES = range(4)
+    OUTCOMES = ('Victory', 'Red_Cell', 'Out_Of_Bounds', 'Out_Of_Moves')
+
+    PLAYER_PHASE, CELL_PHASE = range(2)
+
+    DELTAS = {'Up': (0, -1), 'Down': (0, 1), 'Left': (-1, 0), 'Right': (1, 0)}
+
+    def Run(self, level, moves) -> tuple:
+        '''Plays the moves on the level and returns (outcome, step, phase),
+        step being the index of the move during which the run ended.
+        Moves past the move limit of the level are ignored, like the keys past the last input label,
+        and an empty pile runs out of moves before its first step'''
+        width, height = level.width, level.height
+        y, x = divmod(level.player_start, width)
+        victory, red = level.victory_move, level.red_masks
+        deltas = self.DELTAS
+
+        step = 0
+        for step, move in enumerate(moves[:level.move_limit]):
+            dx, dy = deltas[move]
+            x += dx
+            y += dy
+            if x < 0 or x >= width or y < 0 or y >= height:
+                return (self.OUT_OF_BOUNDS, step, self.PLAYER_PHASE)
+
+            # Negative indexes wrap around, like the step-1 of the first move in the game
+            cell = y*width + x
+            if cell == victory[step-1]:
+                return (self.VICTORY, step, self.PLAYER_PHASE)
+            if red[step-1] >> cell & 1:
+                return (self.RED_CELL, step, self.PLAYER_PHASE)
+            if cell == victory[step]:
+                return (self.VICTORY, step, self.CELL_PHASE)
+            if red[step] >> cell & 1:
+                return (self.RED_CELL, step, self.CELL_PHASE)
+
+        return (self.OUT_OF_MOVES, step, self.CELL_PHASE if moves else self.PLAYER_PHASE)
+
+    def Step(self, level, cell, step, move) -> tuple:
+        '''Plays a single move from the cell with the rules of Run,
+        returns (cell, outcome), outcome being None if the run goes on'''
+        y, x = divmod(cell, level.width)
+        dx, dy = self.DELTAS[move]
+        x += dx
+        y += dy
+        if x < 0 or x >= level.width or y < 0 or y >= level.height:
+            return (cell, self.OUT_OF_BOUNDS)
+
+        cell = y*level.width + x
+        if cell == level.victory_move[step-1]:
+            return (cell, self.VICTORY)
+        if level.red_masks[step-1] >> cell & 1:
+            return (cell, self.RED_CELL)
+        if cell == level.victory_move[step]:
+            return (cell, self.VICTORY)
+        if level.red_masks[step] >> cell & 1:
+            return (cell, self.RED_CELL)
+        return (cell, None)
+
+
+class BatchVerifier:
+    '''Checks many move piles against a level at once with NumPy array operations,
+    following exactly the rules of the Simulator.
+    Piles are given as an (N, move limit) array of direction codes (CODES), shorter piles padded with NO_MOVE'''
+
+    CODES = {'Up': 0, 'Down': 1, 'Left': 2, 'Right': 3}
+    NO_MOVE = -1
+
+    # Indexed by the direction code, NO_MOVE (-1) reads the last value and doesn't move the player
+    DX = (0, 0, -1, 1, 0)
+    DY = (-1, 1, 0, 0, 0)
+
+    def __init__(self, chunk_size=65536):
+        '''chunk_size is the amount of piles processed together, bounding the memory used'''
+        if not self.Available():
+            raise ImportError('the BatchVerifier requires NumPy')
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    @functools.cache
+    def Available() -> bool:
+        '''Imports NumPy in the global np on the first call, returns whether it is installed'''
+        global np
+        try:
+            import numpy
+        except ImportError:
+            return False
+        np = numpy
+        return True
+
+    @classmethod
+    def Encode(cls, piles, length=Level.DEFAULTS['Move_Limit']):
+        '''Converts a list of piles of 'Up'/'Down'/'Left'/'Right' to an array of direction codes'''
+        if not cls.Available():
+            raise ImportError('the BatchVerifier requires NumPy')
+        piles = [pile[:length] for pile in piles]
+        counts = np.fromiter(map(len, piles), dtype=np.intp, count=len(piles))
+        total = int(counts.sum())
+        moves = np.fromiter(map(cls.CODES.__getitem__, itertools.chain.from_iterable(piles)), dtype=np.int8, count=total)
+
+        # The moves of every pile are written at once, at their row and their index inside the pile
+        codes = np.full((len(piles), length), cls.NO_MOVE, dtype=np.int8)
+        rows = np.repeat(np.arange(len(piles)), counts)
+        columns = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        codes[rows, columns] = moves
+        return codes
+
+    def Run(self, level, codes) -> tuple:
+        '''Returns the outcome, step and phase arrays of every pile, with the Simulator meaning'''
+        codes = np.asarray(codes)
+        if codes.dtype.kind in 'UO':
+            codes = np.vectorize(lambda move: self.CODES.get(move, self.NO_MOVE), otypes=[np.int8])(codes)
+        if codes.ndim != 2:
+            raise ValueError('piles must be an (N, moves) array')
+        if codes.size and (codes.min() < self.NO_MOVE or codes.max() > 3):
+            raise ValueError('unknown direction code')
+
+        # Moves past the move limit of the level are ignored, like in the Simulator
+        codes = codes[:, :level.move_limit]
+
+        outcomes = np.empty(len(codes), dtype=np.int8)
+        steps = np.empty(len(codes), dtype=np.int16)
+        phases = np.empty(len(codes), dtype=np.int8)
+
+        tables = self.Tables(level, codes.shape[1])
+        for start in range(0, len(codes), self.chunk_size):
+            end = start + self.chunk_size
+            outcomes[start:end], steps[start:end], phases[start:end] = self.RunChunk(level, tables, codes[start:end])
+
+        return outcomes, steps, phases
+
+    def Tables(self, level, length) -> tuple:
+        '''Victory cell and red cells occupancy of every step, before and after the cells move'''
+        victory = np.fromiter(level.victory_move, dtype=np.int64, count=len(level.victory_move))
+
+        # Unpacked from the red masks read by the Simulator, so both see the same steps whatever the Move list lengths
+        cells = level.width*level.height
+        size = (cells + 7) // 8
+        masks = np.frombuffer(b''.join(mask.to_bytes(size, 'little') for mask in level.red_masks), dtype=np.uint8)
+        red = np.unpackbits(masks.reshape(-1, size), axis=1, count=cells, bitorder='little').astype(bool)
+
+        # Step -1 reads the last step, like the negative index of the game.
+        # The red tables are flattened to be indexed with step * cells + cell
+        before = np.arange(length) - 1
+        after = np.arange(length)
+        return victory[before], red[before].ravel(), victory[after], red[after].ravel()
+
+    def RunChunk(self, level, tables, codes) -> tuple:
+        '''Evaluates a chunk of piles, every (pile, step, phase) event is computed
+        then the first one of each pile gives its outcome'''
+        victory_before, red_before, victory_after, red_after = tables
+        count, length = codes.shape
+        columns = np.arange(length)
+
+        # A pile ends at its first NO_MOVE
+        padded = np.concatenate((codes, np.full((count, 1), self.NO_MOVE, dtype=codes.dtype)), axis=1)
+        lengths = np.argmax(padded == self.NO_MOVE, axis=1)
+        played = columns < lengths[:, None]
+
+        # Player trajectories, the cumulative sums of the moves
+        y0, x0 = divmod(level.player_start, level.width)
+        index = codes.astype(np.intp)
+        x = x0 + np.cumsum(np.asarray(self.DX, dtype=np.int32).take(index), axis=1, dtype=np.int32)
+        y = y0 + np.cumsum(np.asarray(self.DY, dtype=np.int32).take(index), axis=1, dtype=np.int32)
+
+        out = (x < 0) | (x >= level.width) | (y < 0) | (y >= level.height)
+        cell = np.where(out, 0, y*level.width + x)
+        inside = ~out
+        table_index = columns * (level.width*level.height) + cell
+
+        # Player phase : victory, then red cells, then bounds ; cell phase : victory, then red cells
+        player_event = np.where(out, Simulator.OUT_OF_BOUNDS+1,
+                       np.where(inside & (cell == victory_before), Simulator.VICTORY+1,
+                       np.where(inside & red_before[table_index], Simulator.RED_CELL+1, 0)))
+        cell_event = np.where(inside & (cell == victory_after), Simulator.VICTORY+1,
+                     np.where(inside & red_after[table_index], Simulator.RED_CELL+1,
+                     np.where(columns == lengths[:, None]-1, Simulator.OUT_OF_MOVES+1, 0)))
+
+        events = np.stack((player_event * played, cell_event * played), axis=2).reshape(count, 2*length)
+        first = np.argmax(events != 0, axis=1)
+        outcomes = events[np.arange(count), first] - 1
+
+        # Empty piles run out of moves before their first step
+        outcomes[lengths == 0] = Simulator.OUT_OF_MOVES
+        return outcomes, first // 2, first % 2
+
+
+class Analyser:
+    '''Counts the move piles of a level with a dynamic programming over (step, cell) :
+    the number of piles reaching each cell alive after a step is enough to get the next step,
+    so the 4^15 inputs are never enumerated. Each landing is judged by Simulator.Step, the rules are not copied here'''
+
+    def Analyse(self, level) -> dict:
+        '''Returns the difficulty report of the level :
+        wins_at_step[i] counts the piles winning on their move i+1,
+        winning_piles[i] counts the piles of i+1 moves that win, on their last move or before,
+        survivors[i] counts the piles of i+1 moves still alive after their last move,
+        surviving_inputs[i] counts the full inputs still alive after the move i+1'''
+        simulator = Simulator()
+        move_limit = level.move_limit
+
+        counts = {level.player_start: 1} # cell -> amount of piles alive on it
+        wins_at_step = []
+        survivors = []
+
+        for step in range(move_limit):
+            wins = 0
+            next_counts = {}
+            for cell, count in counts.items():
+                for move in Solver.MOVES:
+                    landing, outcome = simulator.Step(level, cell, step, move)
+                    if outcome == Simulator.VICTORY:
+                        wins += count
+                    elif outcome is None:
+                        next_counts[landing] = next_counts.get(landing, 0) + count
+
+            counts = next_counts
+            wins_at_step.append(wins)
+            survivors.append(sum(counts.values()))
+
+        winning_piles = []
+        total = 0
+        for wins in wins_at_step:
+            total = total*4 + wins
+            winning_piles.append(total)
+
+        winning_lengths = [i+1 for i, wins in enumerate(wins_at_step) if wins]
+        win_rate = winning_piles[-1] / 4**move_limit if move_limit else 0.0
+
+        return {'level': level.name,
+                'solvable': bool(winning_lengths),
+                'shortest': winning_lengths[0] if winning_lengths else None,
+                'longest': winning_lengths[-1] if winning_lengths else None,
+                'wins_at_step': wins_at_step,
+                'winning_piles': winning_piles,
+                'survivors': survivors,
+                'surviving_inputs': [count * 4**(move_limit-i-1) for i, count in enumerate(survivors)],
+                'win_rate': win_rate,
+                # Bits of luck needed by a random full input, None if the level can't be won
+                'difficulty': round(-math.log2(win_rate), 3) if win_rate else None}
+
+    def Report(self, repository, names):
+        '''Yields the report of every level name'''
+        for name in names:
+            yield self.Analyse(repository.Get(name))
+
+
+class RulesCheck:
+    '''Regression check of the implementations of the level rules against each other :
+    random piles, piles following the hints and the Solver path are played by the Simulator, the reference,
+    then by the BatchVerifier, and their wins are compared with the Solver and the HintTable.
+    The Analyser counts are compared with the Solver, with the winning piles, and with every pile
+    of the first ANALYSER_DEPTH moves played by the Simulator'''
+    ANALYSER_DEPTH = 6
+
+    def __init__(self, piles=2000, seed=0):
+        '''piles is the amount of random piles played on each level'''
+        self.piles = piles
+        self.seed = seed
+        self.simulator = Simulator()
+
+    def Check(self, level) -> list:
+        '''Returns the list of the disagreements found on the level, empty if every implementation agrees'''
+        errors = []
+        generator = random.Random(self.seed)
+        moves = level.move_limit
+        piles = [[generator.choice(Solver.MOVES) for _ in range(generator.randint(0, moves))] for _ in range(self.piles)]
+
+        path = Solver().Solve(level).path
+        hints = HintTable(level)
+        if path is not None:
+            piles.append(path)
+            if self.simulator.Run(level, path)[:2] != (Simulator.VICTORY, len(path)-1):
+                errors.append('the Solver path %s does not win' % path)
+        if hints.Winnable(0, level.player_start) != (path is not None):
+            errors.append('the HintTable and the Solver disagree on the level being winnable')
+
+        # Piles choosing a random hint at every step, all of them must win
+        for _ in range(self.piles // 10 if path is not None else 0):
+            pile = []
+            cell, outcome = level.player_start, None
+            while outcome is None and len(pile) < moves:
+                choices = hints.NextMoves(len(pile), cell)
+                if not choices:
+                    break
+                pile.append(generator.choice(choices))
+                cell, outcome = self.simulator.Step(level, cell, len(pile)-1, pile[-1])
+            if self.simulator.Run(level, pile)[0] != Simulator.VICTORY:
+                errors.append('%s follows the HintTable but does not win' % pile)
+            piles.append(pile)
+
+        results = [self.simulator.Run(level, pile) for pile in piles]
+        if BatchVerifier.Available():
+            outcomes, steps, phases = BatchVerifier().Run(level, BatchVerifier.Encode(piles, moves))
+            for pile, result, batch in zip(piles, results, zip(outcomes.tolist(), steps.tolist(), phases.tolist())):
+                if result != batch:
+                    errors.append('%s : Simulator %s, BatchVerifier %s' % (pile, result, batch))
+
+        for pile, (outcome, step, phase) in zip(piles, results):
+            if outcome != Simulator.VICTORY:
+                continue
+            if path is None or step+1 < len(path):
+                errors.append('%s wins in %d moves, the Solver found %s' % (pile, step+1, path))
+            # Every move of a winning pile keeps the level winnable
+            cell = level.player_start
+            for i, move in enumerate(pile[:step+1]):
+                if move not in hints.NextMoves(i, cell):
+                    errors.append('%s wins but the HintTable refuses its move %d' % (pile, i))
+                    break
+                cell = self.simulator.Step(level, cell, i, move)[0]
+
+        report = Analyser().Analyse(level)
+        if report['shortest'] != (len(path) if path is not None else None):
+            errors.append('the Analyser shortest win is %s moves, the Solver path %s' % (report['shortest'], path))
+        for pile, (outcome, step, phase) in zip(piles, results):
+            if outcome == Simulator.VICTORY and not report['wins_at_step'][step]:
+                errors.append('%s wins on its move %d, the Analyser counts no win there' % (pile, step+1))
+
+        # A pile winning at step s stands for the 4^(depth-1-s) piles sharing its first s+1 moves
+        depth = min(self.ANALYSER_DEPTH, moves)
+        wins = [0] * depth
+        survivors = 0
+        for pile in itertools.product(Solver.MOVES, repeat=depth):
+            outcome, step, phase = self.simulator.Run(level, pile)
+            if outcome == Simulator.VICTORY:
+                wins[step] += 1
+            elif outcome == Simulator.OUT_OF_MOVES:
+                survivors += 1
+        expected = [count // 4**(depth-1-step) for step, count in enumerate(wins)]
+        if report['wins_at_step'][:depth] != expected or (depth and report['survivors'][depth-1] != survivors):
+            errors.append('the Analyser counts %s wins and %d survivors in the first %d moves, the Simulator %s and %d'
+                          % (report['wins_at_step'][:depth], report['survivors'][depth-1], depth, expected, survivors))
+        return errors
+
+    def Report(self, repository, names):
+        '''Yields the check result of every level name'''
+        for name in names:
+            errors = self.Check(repository.Get(name))
+            yield {'level': name, 'ok': not errors, 'errors': errors[:20]}
+
+
+class WorkerPool:
+    '''Process pool keeping a bounded amount of tasks in flight,
+    so the memory stays flat however many items are given. Results are yielded in order'''
+    def __init__(self, jobs=None, window=4):
+        '''jobs is the amount of processes, all the cores if None, 1 runs everything in this process.
+        window is the amount of tasks in flight per process'''
+        self.jobs = jobs or os.cpu_count() or 1
+        self.window = window
+        self.executor = None
+
+    def __enter__(self):
+        '''Keeps the processes alive between the calls until the with block ends,
+        instead of starting them again for every call'''
+        if self.jobs > 1:
+            self.executor = ProcessPoolExecutor(self.jobs)
+        return self
+
+    def __exit__(self, *exception):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def Executor(self):
+        '''Returns a context giving the kept executor, or a new one closed at the end of the call'''
+        if self.executor is not None:
+            return contextlib.nullcontext(self.executor)
+        return ProcessPoolExecutor(self.jobs)
+
+    def Map(self, function, items):
+        '''Yields function(item) for every item, function must be picklable (module level or static)'''
+        if self.jobs == 1:
+            for item in items:
+                yield function(item)
+            return
+
+        with self.Executor() as executor:
+            pending = deque()
+            for item in items:
+                pending.append(executor.submit(function, item))
+                if len(pending) >= self.jobs * self.window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def Stream(self, function, items):
+        '''Like Map, but the items are read by a thread so each result is yielded as soon as it is ready,
+        even while the next item is slow to come (a client waiting for its answers before sending more).
+        Reading stops while the tasks in flight are not consumed, the slow reader holds back the input'''
+        if self.jobs == 1:
+            yield from self.Map(function, items)
+            return
+
+        with self.Executor() as executor:
+            futures = queue.Queue()
+            slots = threading.Semaphore(self.jobs * self.window)
+            stopped = threading.Event()
+
+            def Submit():
+                try:
+                    for item in items:
+                        slots.acquire()
+                        if stopped.is_set():
+                            return
+                        futures.put(executor.submit(function, item))
+                    futures.put(None)
+                except BaseException as error:
+                    futures.put(error)
+
+            threading.Thread(target=Submit, daemon=True).start()
+            try:
+                while True:
+                    future = futures.get()
+                    if future is None:
+                        return
+                    if isinstance(future, BaseException):
+                        raise future
+                    result = future.result()
+                    slots.release()
+                    yield result
+            finally:
+                # The results are not wanted anymore, the reading thread is woken up to stop
+                stopped.set()
+                slots.release()
+
+
+class Validator:
+    '''Validates and solves level files, used by the validate command in the worker processes'''
+    caches = {} # path -> SolutionCache opened by this process
+
+    @staticmethod
+    def LevelPaths(folder_path):
+        '''Yields the json files of the folder without listing the whole folder in memory'''
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    yield entry.path
+
+    @staticmethod
+    def Check(path, cache_path=None) -> dict:
+        '''Returns the validation result of a level file as a json ready dictionary,
+        the solution being read from the SolutionCache at cache_path if given'''
+        name = os.path.basename(path)[:-5]
+        result = {'level': name, 'valid': False, 'errors': [], 'solvable': None, 'solution': None, 'solve_time': None}
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lv_data = json.load(f)
+        except (OSError, ValueError) as error:
+            result['errors'].append('unreadable json : %s' % error)
+            return result
+
+        result['errors'] = Level.Validate(lv_data)
+        if result['errors']:
+            return result
+        result['valid'] = True
+
+        level = Level.FromJson(name, lv_data)
+        start = time.perf_counter()
+        if cache_path is None:
+            solution = Solver().Solve(level)
+        else:
+            if cache_path not in Validator.caches:
+                Validator.caches[cache_path] = SolutionCache(cache_path)
+            solution = Validator.caches[cache_path].Solve(level)
+        result['solve_time'] = time.perf_counter() - start
+
+        result['solvable'] = solution.solvable
+        result['solution'] = solution.path
+        return result
+
+
+class AttemptReplay:
+    '''Plays the attempts of an AttemptLog again on the current levels, by batches of each level
+    given to the BatchVerifier (the Simulator without NumPy), and sums where and when the runs failed'''
+    def __init__(self, repository, batch=65536):
+        '''batch is the amount of attempts of a level evaluated together, bounding the memory used'''
+        self.Levels = repository
+        self.batch = batch
+        self.verifier = BatchVerifier(batch) if BatchVerifier.Available() else None
+        self.simulator = Simulator()
+
+    def Run(self, log_path):
+        '''Streams the log and returns the report of every level, sorted by name'''
+        reports = {}
+        pending = {} # level name -> attempts waiting for their batch
+        for name, packed, count, outcome, step, phase, timestamp in AttemptLog.Read(log_path):
+            attempts = pending.get(name)
+            if attempts is None:
+                attempts = pending[name] = []
+            attempts.append((packed, count, outcome, step, phase))
+            if len(attempts) >= self.batch:
+                self.Evaluate(reports, name, attempts)
+                attempts.clear()
+
+        for name, attempts in pending.items():
+            if attempts:
+                self.Evaluate(reports, name, attempts)
+        return [reports[name] for name in sorted(reports)]
+
+    def Evaluate(self, reports, name, attempts):
+        '''Adds a batch of attempts of a level to its report'''
+        if name not in reports:
+            reports[name] = {'level': name, 'attempts': 0, 'missing': False, 'changed': 0}
+        report = reports[name]
+        report['attempts'] += len(attempts)
+
+        try:
+            level = self.Levels.Get(name)
+        except (OSError, KeyError, ValueError):
+            report['missing'] = True # The level was deleted or broken since the attempts were played
+            return
+
+        if 'outcomes' not in report:
+            report['outcomes'] = {outcome: 0 for outcome in Simulator.OUTCOMES}
+            report['fail_steps'] = [0] * level.move_limit
+            report['heatmap'] = [[0] * level.width for _ in range(level.height)]
+
+        if self.verifier is None:
+            for (packed, count, outcome, step, phase) in attempts:
+                new_outcome, new_step, new_phase, cell = self.Play(level, AttemptLog.UnpackMoves(packed, count))
+                report['outcomes'][Simulator.OUTCOMES[new_outcome]] += 1
+                if (outcome, step, phase) != (new_outcome, new_step, new_phase):
+                    report['changed'] += 1 # The level was edited since the attempt
+                if new_outcome != Simulator.VICTORY:
+                    report['fail_steps'][min(new_step, level.move_limit-1)] += 1
+                    row, column = divmod(cell, level.width)
+                    report['heatmap'][row][column] += 1
+            return
+
+        outcomes, steps, phases, cells = self.PlayBatch(level, attempts)
+        recorded = np.array([attempt[2:] for attempt in attempts], dtype=np.int64).reshape(-1, 3)
+        report['changed'] += int(np.count_nonzero((recorded[:, 0] != outcomes) | (recorded[:, 1] != steps) | (recorded[:, 2] != phases)))
+        for outcome, amount in enumerate(np.bincount(outcomes, minlength=len(Simulator.OUTCOMES)).tolist()):
+            report['outcomes'][Simulator.OUTCOMES[outcome]] += amount
+
+        failed = outcomes != Simulator.VICTORY
+        fail_steps = np.bincount(np.minimum(steps[failed], level.move_limit-1), minlength=level.move_limit)
+        report['fail_steps'] = [total + amount for total, amount in zip(report['fail_steps'], fail_steps.tolist())]
+        heatmap = np.bincount(cells[failed], minlength=level.width*level.height).reshape(level.height, level.width)
+        report['heatmap'] = (np.asarray(report['heatmap']) + heatmap).tolist()
+
+    def Play(self, level, moves) -> tuple:
+        '''Returns the (outcome, step, phase, cell) of a pile with the Simulator,
+        cell being where the player stood when the run ended, before leaving the board for Out_Of_Bounds'''
+        moves = moves[:level.move_limit]
+        outcome, step, phase = self.simulator.Run(level, moves)
+        cell = level.player_start
+        for i in range(min(step+1, len(moves))):
+            next_cell, end = self.simulator.Step(level, cell, i, moves[i])
+            if end != Simulator.OUT_OF_BOUNDS:
+                cell = next_cell
+        return outcome, step, phase, cell
+
+    def PlayBatch(self, level, attempts) -> tuple:
+        '''Returns the outcome, step, phase and cell arrays of the attempts with the BatchVerifier, like Play'''
+        length = min(level.move_limit, max(count for packed, count, *_ in attempts))
+        size = (length+3) >> 2
+
+        # The packed moves are unpacked with array operations, 4 moves per byte
+        packed = np.frombuffer(b''.join(packed[:size].ljust(size, b'\0') for packed, *_ in attempts), dtype=np.uint8).reshape(-1, size)
+        codes = ((packed[:, :, None] >> np.array([0, 2, 4, 6], dtype=np.uint8)) & 3).reshape(len(attempts), size*4)[:, :length].astype(np.int8)
+        counts = np.array([count for packed, count, *_ in attempts])
+        codes[np.arange(length) >= counts[:, None]] = BatchVerifier.NO_MOVE
+        outcomes, steps, phases = self.verifier.Run(level, codes)
+
+        # Position after each move, the move leaving the board is not counted
+        index = codes.astype(np.intp)
+        y0, x0 = divmod(level.player_start, level.width)
+        x = x0 + np.cumsum(np.asarray(BatchVerifier.DX, dtype=np.int32).take(index), axis=1, dtype=np.int32)
+        y = y0 + np.cumsum(np.asarray(BatchVerifier.DY, dtype=np.int32).take(index), axis=1, dtype=np.int32)
+        rows = np.arange(len(attempts))
+        last = np.minimum(steps, max(length-1, 0)).astype(np.intp)
+        if length:
+            before = np.where(last > 0, y[rows, last-1]*level.width + x[rows, last-1], level.player_start)
+            cells = np.where(outcomes == Simulator.OUT_OF_BOUNDS, before, y[rows, last]*level.width + x[rows, last])
+        else:
+            cells = np.full(len(attempts), level.player_start)
+        return outcomes, steps, phases, cells
+
+
+class Grader:
+    '''Grades submitted move piles given as json lines {"id": ..., "level": name, "moves": ["Up", ...]}
+    and answers a verdict line per submission, in the same order :
+    {"id": ..., "level": name, "outcome": "Victory", "step": 12, "phase": 0}, or {"id": ..., "error": message},
+    outcome, step and phase having the meaning of the Simulator.
+    The input is cut in blocks of whole lines graded by the WorkerPool, each process keeping its parsed levels,
+    and the submissions of a block are grouped by level to be checked together by the BatchVerifier'''
+    CHUNK_SIZE = 1 << 18 # bytes read at most per block
+    BATCH_MIN = 32 # submissions of a level below which the Simulator is faster than the BatchVerifier
+    MOVES = frozenset(Simulator.DELTAS)
+    NOT_JSON = object() # stands for the lines that could not be decoded
+    Dumps = json.JSONEncoder(ensure_ascii=False).encode
+    repositories = {} # folder path -> LevelRepository of this process
+    checked = {} # (folder path, level name) -> Level that passed Level.Validate
+    verifier = None
+
+    def __init__(self, folder_path, jobs=None, chunk_size=CHUNK_SIZE):
+        '''jobs is the amount of worker processes, all the cores if None'''
+        self.folder_path = folder_path
+        self.pool = WorkerPool(jobs)
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def Chunks(stream, size):
+        '''Yields the bytes of the stream by blocks of whole lines, as soon as they are received
+        but never much more than size bytes'''
+        rest = b''
+        while True:
+            data = stream.read1(size)
+            if not data:
+                if rest:
+                    yield rest
+                return
+            data = rest + data
+            end = data.rfind(b'\n') + 1
+            rest = data[end:]
+            if end:
+                yield data[:end]
+
+    def Serve(self, reader, writer):
+        '''Grades every submission of the reader and writes the verdicts to the writer as they come'''
+        function = functools.partial(Grader.GradeChunk, self.folder_path)
+        for verdicts in self.pool.Stream(function, self.Chunks(reader, self.chunk_size)):
+            writer.write(verdicts)
+            writer.flush()
+
+    def Listen(self, address):
+        '''Serves the clients of the socket one after the other, with the same worker processes.
+        address is the path of a unix socket, or a port number of the local machine'''
+        if isinstance(address, int):
+            server = socket.create_server(('127.0.0.1', address))
+        else:
+            # Socket left by a server that was not stopped cleanly
+            if os.path.exists(address) and stat.S_ISSOCK(os.stat(address).st_mode):
+                os.remove(address)
+            server = socket.socket(socket.AF_UNIX)
+            server.bind(address)
+            server.listen()
+
+        with server, self.pool:
+            while True:
+                connection, _ = server.accept()
+                try:
+                    with connection, connection.makefile('rb') as reader, connection.makefile('wb') as writer:
+                        self.Serve(reader, writer)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass # The client left without reading every verdict
+
+    @classmethod
+    def GradeChunk(cls, folder_path, data) -> bytes:
+        '''Returns the verdict lines of a block of submission lines, runs in the worker processes'''
+        repository = cls.repositories.get(folder_path)
+        if repository is None:
+            repository = cls.repositories[folder_path] = LevelRepository(folder_path)
+
+        lines = [line for line in data.splitlines() if line.strip()]
+        verdicts = [None] * len(lines)
+        groups = {} # level name -> indexes, ids and move piles of its submissions
+
+        # Every line is decoded on its own, a broken line must not lend its content to the next ones
+        submissions = []
+        for line in lines:
+            try:
+                submissions.append(json.loads(line))
+            except ValueError:
+                submissions.append(cls.NOT_JSON)
+
+        for i, submission in enumerate(submissions):
+            if submission is cls.NOT_JSON:
+                verdicts[i] = '{"id":null,"error":"not a json line"}'
+                continue
+            if not isinstance(submission, dict):
+                submission = {}
+            identity = submission.get('id')
+            identity = str(identity) if type(identity) is int else cls.Dumps(identity)
+            name = submission.get('level')
+            moves = submission.get('moves')
+            try:
+                valid = isinstance(name, str) and isinstance(moves, list) and cls.MOVES.issuperset(moves)
+            except TypeError:
+                valid = False # unhashable moves
+            if not valid:
+                verdicts[i] = '{"id":%s,"error":"a submission needs a level name and a list of Up, Down, Left or Right moves"}' % identity
+                continue
+            group = groups.get(name)
+            if group is None:
+                group = groups[name] = ([], [], [])
+            group[0].append(i)
+            group[1].append(identity)
+            group[2].append(moves)
+
+        for name, (indexes, identities, piles) in groups.items():
+            try:
+                level = cls.Load(repository, name)
+            except FileNotFoundError:
+                error = cls.Dumps('unknown level ' + name)
+            except (OSError, KeyError, ValueError, TypeError, IndexError) as exception:
+                error = cls.Dumps('invalid level %s : %s' % (name, exception))
+            else:
+                error = None
+            if error is not None:
+                for i, identity in zip(indexes, identities):
+                    verdicts[i] = '{"id":%s,"error":%s}' % (identity, error)
+                continue
+
+            level_name = cls.Dumps(name)
+            for i, identity, (outcome, step, phase) in zip(indexes, identities, cls.Grade(level, piles)):
+                verdicts[i] = '{"id":%s,"level":%s,"outcome":"%s","step":%d,"phase":%d}' % (
+                    identity, level_name, Simulator.OUTCOMES[outcome], step, phase)
+
+        if not verdicts:
+            return b''
+        return ('\n'.join(verdicts) + '\n').encode('utf-8')
+
+    @classmethod
+    def Load(cls, repository, name) -> Level:
+        '''Returns the Level of the given name, its file being checked by Level.Validate
+        the first time this process meets each version of it. Raises ValueError for a broken level'''
+        if os.path.basename(name) != name:
+            raise FileNotFoundError('a level name is a file of the folder')
+        level = repository.Get(name)
+        key = (repository.folder_path, name)
+        if cls.checked.get(key) is not level:
+            with open(os.path.join(repository.folder_path, name + '.json'), 'rb') as f:
+                errors = Level.Validate(json.loads(f.read()))
+            if errors:
+                raise ValueError(', '.join(errors))
+            cls.checked[key] = level
+        return level
+
+    @classmethod
+    def Grade(cls, level, piles) -> list:
+        '''Returns the (outcome, step, phase) of every pile of the level'''
+        if len(piles) < cls.BATCH_MIN or not BatchVerifier.Available():
+            simulator = Simulator()
+            return [simulator.Run(level, pile) for pile in piles]
+
+        if cls.verifier is None:
+            cls.verifier = BatchVerifier()
+        outcomes, steps, phases = cls.verifier.Run(level, BatchVerifier.Encode(piles, level.move_limit))
+        return zip(outcomes.tolist(), steps.tolist(), phases.tolist())
+
+
+class Benchmark:
+    '''Reproducible benchmark suite measuring the level loading, the Solver, the Simulator,
+    the BatchVerifier and the canvas redraw, on the shipped levels and on synthetic ones.
+    Results are written as json to be compared across commits'''
+    def __init__(self, min_time=0.2, seed=0):
+        '''min_time is the minimal duration of each measure in seconds'''
+        self.min_time = min_time
+        self.seed = seed
+        self.results = []
+        self.window = None # hidden Tk window of the canvas measures, opened by Run when there is a display
+
+    @staticmethod
+    def SyntheticLevel(width, height, red_count, steps, seed=0, cell_size=75) -> dict:
+        '''Returns the json data of a random level : the player starts on the left column,
+        the victory cell and the red cells wander randomly, never stepping on the start'''
+        generator = random.Random(seed)
+        start = (0, generator.randrange(height))
+
+        def Walk(position):
+            path = []
+            for _ in range(steps):
+                dx, dy = generator.choice(((0, 0), (0, 1), (0, -1), (1, 0), (-1, 0)))
+                x, y = position[0]+dx, position[1]+dy
+                if 0 <= x < width and 0 <= y < height and (x, y) != start:
+                    position = (x, y)
+                path.append([position[0]*cell_size, position[1]*cell_size])
+            return path
+
+        def Cell():
+            while True:
+                position = (generator.randrange(width), generator.randrange(height))
+                if position != start:
+                    return position
+
+        victory_start = (width-1, generator.randrange(height))
+        red_starts = [Cell() for _ in range(red_count)]
+        return {'Identity': 'Synthetic %dx%d' % (width, height),
+                'Board_Width': width, 'Board_Height': height, 'Cell_Size': cell_size, 'Move_Limit': steps,
+                'Player_Starter_Coo': [start[0]*cell_size, start[1]*cell_size],
+                'Victory_Cell_Starting_Coo': [victory_start[0]*cell_size, victory_start[1]*cell_size],
+                'Victory_Cell_Move': Walk(victory_start),
+                'Red_Cells_Starter_Coo': [[x*cell_size, y*cell_size] for x, y in red_starts],
+                'Red_Cells_Move': [Walk(position) for position in red_starts],
+                'Arrow': []}
+
+    def Measure(self, name, level_name, function, operations=1, params=None):
+        '''Calls function until min_time is spent, then once more under tracemalloc for the peak memory.
+        operations is the amount of operations done by one call'''
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            function()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= self.min_time:
+                break
+
+        tracemalloc.start()
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        result = {'benchmark': name, 'level': level_name, 'ops_per_sec': calls*operations/elapsed,
+                  'peak_memory': peak, 'params': params or {}}
+        self.results.append(result)
+        return result
+
+    def RunLevel(self, name, text, params=None):
+        '''Runs every benchmark on one level given as json text'''
+        level = Level.FromJson(name, json.loads(text))
+        steps = level.move_limit
+        generator = random.Random(self.seed)
+
+        yield self.Measure('json_load', name, lambda: Level.FromJson(name, json.loads(text)), params=params)
+
+        solver = Solver()
+        yield self.Measure('solve', name, lambda: solver.Solve(level), params=params)
+
+        simulator = Simulator()
+        moves = list(Simulator.DELTAS)
+        piles = [[generator.choice(moves) for _ in range(steps)] for _ in range(1000)]
+        def Simulate():
+            for pile in piles:
+                simulator.Run(level, pile)
+        yield self.Measure('simulate', name, Simulate, len(piles), params=params)
+
+        if BatchVerifier.Available():
+            verifier = BatchVerifier()
+            codes = np.random.default_rng(self.seed).integers(0, 4, size=(10000, steps), dtype=np.int8)
+            yield self.Measure('batch_verify', name, lambda: verifier.Run(level, codes), len(codes), params=params)
+
+        if self.window is not None:
+            yield self.MeasureCanvas(name, level, params=params)
+
+    def MeasureCanvas(self, name, level, params):
+        '''Times Canvas.CanCellUpdate, the canvas only needs the level and step of the LevelOperator
+        and a repository giving the level to SetLevel'''
+        operator = SimpleNamespace(level=level, step=0, player_coo=list(level.Coo(level.player_start)))
+        canvas = Canvas(SimpleNamespace(Level=operator, Levels=SimpleNamespace(Get=lambda level_name: level)), self.window)
+        canvas.SetLevel(name)
+        def Update():
+            operator.step = operator.step % len(level.victory_move) + 1
+            canvas.CanCellUpdate()
+            canvas.update_idletasks()
+        result = self.Measure('canvas_cell_update', name, Update, params=params)
+        result['frames'] = canvas.Stats()
+        canvas.destroy()
+        return result
+
+    def Run(self, folder_path, sizes=((10, 5),), red_counts=(8,), steps=(15,)):
+        '''Runs the suite on the levels of the folder then on every synthetic level combination'''
+        try:
+            self.window = tk.Tk()
+            self.window.withdraw()
+        except tk.TclError:
+            self.window = None # No display, the canvas is not measured
+
+        for name in Main.ListLevelFiles(folder_path):
+            with open(os.path.join(folder_path, name + '.json'), 'r', encoding='utf-8') as f:
+                text = f.read()
+            yield from self.RunLevel(name, text)
+
+        for width, height in sizes:
+            for red_count in red_counts:
+                for step_count in steps:
+                    lv_data = self.SyntheticLevel(width, height, red_count, step_count, self.seed)
+                    name = 'synthetic_%dx%d_%dred_%dsteps' % (width, height, red_count, step_count)
+                    params = {'width': width, 'height': height, 'red_cells': red_count, 'steps': step_count}
+                    yield from self.RunLevel(name, json.dumps(lv_data), params)
+
+        if self.window is not None:
+            self.window.destroy()
+            self.window = None
+
+    def Report(self) -> dict:
+        '''Returns the results with what is needed to compare them across commits'''
+        try:
+            commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                    cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+        except OSError:
+            commit = None
+
+        return {'commit': commit, 'timestamp': time.time(), 'python': platform.python_version(),
+                'platform': platform.platform(), 'min_time': self.min_time, 'seed': self.seed,
+                'results': self.results}
+
+
+class LevelGenerator:
+    '''Procedural level generator : random boards with patrolling and looping red cells are
+    verified by the Solver and kept only if they match the target difficulty.
+    Instances are picklable so Attempt can run in the WorkerPool processes'''
+
+    # Arrow drawn from a cell toward the next position of a moving cell
+    GLYPHS = {(0, -1): '⮝', (0, 1): '⮟', (-1, 0): '⮜', (1, 0): '⮞'}
+    # Side used when several arrows share a cell, as in the hand made levels
+    SIDES = {'⮟': 'left', '⮝': 'right', '⮞': 'up', '⮜': 'down'}
+
+    def __init__(self, width=10, height=5, steps=15, red_cells=(4, 10), min_length=10, min_solutions=1, max_solutions=None, cell_size=75):
+        '''red_cells is the (minimum, maximum) amount of red cells,
+        min_length the minimal length of the shortest solution,
+        min_solutions and max_solutions bound the amount of distinct solutions (piles winning on their last move)'''
+        self.width = width
+        self.height = height
+        self.steps = steps
+        self.red_cells = red_cells
+        self.min_length = min_length
+        self.min_solutions = min_solutions
+        self.max_solutions = max_solutions
+        self.cell_size = cell_size
+
+    def Motion(self, generator, forbidden) -> list:
+        '''Returns the steps+1 positions of a moving cell : static, patrolling on a line or looping on a rectangle,
+        starting at a random point of its cycle. The forbidden position is never used'''
+        for _ in range(100):
+            x, y = generator.randrange(self.width), generator.randrange(self.height)
+            kind = generator.choice(('static', 'patrol', 'patrol', 'loop'))
+
+            if kind == 'static':
+                cycle = [(x, y)]
+            elif kind == 'patrol':
+                dx, dy = generator.choice(((1, 0), (0, 1)))
+                length = generator.randint(2, 4)
+                line = [(x + dx*i, y + dy*i) for i in range(length)]
+                cycle = line + line[-2:0:-1]
+            else:
+                w, h = generator.randint(1, 3), generator.randint(1, 2)
+                cycle = [(x+i, y) for i in range(w)] + [(x+w, y+j) for j in range(h)] \
+                      + [(x+w-i, y+h) for i in range(w)] + [(x, y+h-j) for j in range(h)]
+                if generator.random() < 0.5:
+                    cycle.reverse()
+
+            if forbidden in cycle or not all(0 <= cx < self.width and 0 <= cy < self.height for cx, cy in cycle):
+                continue
+            offset = generator.randrange(len(cycle))
+            return [cycle[(offset + i) % len(cycle)] for i in range(self.steps+1)]
+
+        return [(x, y)] * (self.steps+1) if (x, y) != forbidden else [((x+1) % self.width, y)] * (self.steps+1)
+
+    def Arrows(self, motions) -> list:
+        '''Returns the Arrow hints showing the path of every moving cell, motions being (positions, colour) pairs'''
+        arrows = {}
+        for positions, colour in motions:
+            for (x, y), (next_x, next_y) in zip(positions, positions[1:]):
+                glyph = self.GLYPHS.get((next_x-x, next_y-y))
+                if glyph is not None:
+                    arrows.setdefault((x, y), {})[glyph] = colour
+
+        arrow_list = []
+        for (x, y), glyphs in arrows.items():
+            for glyph, colour in glyphs.items():
+                if len(glyphs) == 1:
+                    arrow_list.append([x, y, glyph, colour])
+                else:
+                    arrow_list.append([x, y, glyph, colour, self.SIDES[glyph]])
+        return arrow_list
+
+    def Candidate(self, seed) -> dict:
+        '''Returns the json data of a random level'''
+        generator = random.Random(seed)
+        start = (generator.randrange(2), generator.randrange(self.height))
+
+        victory = self.Motion(generator, start)
+        while min(x for x, y in victory) < self.width // 2:
+            victory = self.Motion(generator, start)
+        reds = [self.Motion(generator, start) for _ in range(generator.randint(*self.red_cells))]
+
+        def Coo(position):
+            return [position[0]*self.cell_size, position[1]*self.cell_size]
+
+        # The board fields are only written when they differ from the defaults, keeping the 10x5 levels unchanged
+        board = {key: value for key, value in zip(Level.DEFAULTS, (self.width, self.height, self.cell_size, self.steps))
+                 if value != Level.DEFAULTS[key]}
+        return {**board,
+                'Player_Starter_Coo': Coo(start),
+                'Victory_Cell_Starting_Coo': Coo(victory[0]),
+                'Victory_Cell_Move': [Coo(position) for position in victory[1:]],
+                'Red_Cells_Starter_Coo': [Coo(red[0]) for red in reds],
+                'Red_Cells_Move': [[Coo(position) for position in red[1:]] for red in reds],
+                'Arrow': self.Arrows([(red, 'red') for red in reds] + [(victory, 'blue')])}
+
+    def Check(self, lv_data):
+        '''Returns the Solver and Analyser results if the level matches the target difficulty, else None'''
+        level = Level.FromJson('', lv_data)
+        solution = Solver().Solve(level)
+        if not solution.solvable or len(solution.path) < self.min_length:
+            return None
+
+        report = Analyser().Analyse(level)
+        solutions = sum(report['wins_at_step'])
+        if solutions < self.min_solutions or (self.max_solutions is not None and solutions > self.max_solutions):
+            return None
+        return solution.path, report
+
+    def Attempt(self, task) -> list:
+        '''Tries the candidates of the given (first seed, amount) task,
+        returns the (seed, json data, solution, difficulty report) of the accepted ones'''
+        first_seed, amount = task
+        accepted = []
+        for seed in range(first_seed, first_seed + amount):
+            lv_data = self.Candidate(seed)
+            result = self.Check(lv_data)
+            if result is not None:
+                accepted.append((seed, lv_data) + result)
+        return accepted
+
+    def Generate(self, count, seed=0, jobs=None, batch=64):
+        '''Yields count accepted levels, candidates being verified in batches spread over the WorkerPool'''
+        def Tasks():
+            first_seed = seed
+            while True:
+                yield (first_seed, batch)
+                first_seed += batch
+
+        for accepted in WorkerPool(jobs).Map(self.Attempt, Tasks()):
+            for level in accepted:
+                yield level
+                count -= 1
+                if count == 0:
+                    return
+
+
+class Instrumentation:
+    '''Timing spans and counters around the hot paths, with an optional cProfile capture.
+    The methods are only wrapped while the instrumentation is enabled and put back when it is disabled,
+    so a disabled instrumentation costs nothing'''
+    FILE_NAME = 'Instrumentation_Stats.json'
+
+    # (class, method) timed by a span named Class.method
+    SPANS = ((Canvas, 'SetLevel'), (Canvas, 'CanPlayerUpdate'), (Canvas, 'CanCellUpdate'),
+             (Root, 'SetLevel'), (Root, 'UpdateInputLabels'), (Root, 'FlushLabels'), (Timeline, 'Tick'),
+             (LevelOperator, 'RunLevel'), (LevelOperator, 'PlayerMove'), (LevelOperator, 'CellMove'),
+             (LevelRepository, 'Get'), (Solver, 'Solve'), (HintTable, '__init__'), (Simulator, 'Run'))
+
+    CREATE_METHODS = ('create_rectangle', 'create_oval', 'create_line', 'create_text')
+
+    def __init__(self):
+        '''Creates the counters, the instrumentation starts disabled'''
+        self.enabled = False
+        self.patches = [] # (class, method name, attribute replaced or None if it was inherited)
+        self.profiler = None
+        self.Reset()
+
+    def Reset(self):
+        self.spans = {} # name -> [calls, total time, max time]
+        self.counters = {}
+
+    def Enable(self, profile=False):
+        '''Wraps the instrumented methods, and starts cProfile if profile is True'''
+        if self.enabled:
+            return
+        self.enabled = True
+
+        for cls, name in self.SPANS:
+            self.Patch(cls, name, lambda function, name='%s.%s' % (cls.__name__, name): self.Span(name, function))
+        for name in self.CREATE_METHODS:
+            self.Patch(Canvas, name, lambda function: self.Counter('canvas_items_created', function))
+        self.Patch(Canvas, 'delete', self.CountDelete)
+        self.Patch(Level, 'FromJson', lambda function: self.Counter('json_loads', function))
+        self.Patch(Solver, 'Solve', self.CountSolve)
+
+        if profile:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def Disable(self):
+        '''Puts the original methods back and stops cProfile, the stats are kept'''
+        if not self.enabled:
+            return
+        self.enabled = False
+
+        for cls, name, original in reversed(self.patches):
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        self.patches = []
+
+        if self.profiler is not None:
+            self.profiler.disable()
+
+    def Patch(self, cls, name, wrap):
+        '''Replaces the method of the class by wrap(method), keeping the classmethod and staticmethod kinds'''
+        original = cls.__dict__.get(name)
+        function = original if original is not None else getattr(cls, name)
+        kind = type(function) if isinstance(function, (classmethod, staticmethod)) else None
+        if kind is not None:
+            function = function.__func__
+
+        wrapper = functools.wraps(function)(wrap(function))
+        setattr(cls, name, kind(wrapper) if kind is not None else wrapper)
+        self.patches.append((cls, name, original))
+
+    def Span(self, name, function):
+        '''Returns function timed under the span name'''
+        spans = self.spans
+        def Timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                span = spans.setdefault(name, [0, 0.0, 0.0])
+                span[0] += 1
+                span[1] += elapsed
+                span[2] = max(span[2], elapsed)
+        return Timed
+
+    def Count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def Counter(self, name, function):
+        '''Returns function counting its calls under the counter name'''
+        def Counted(*args, **kwargs):
+            self.Count(name)
+            return function(*args, **kwargs)
+        return Counted
+
+    def CountDelete(self, function):
+        '''Canvas.delete counting the items of the tags deleted'''
+        def Counted(canvas, *tags):
+            self.Count('canvas_items_deleted', sum(len(canvas.find_withtag(tag)) for tag in tags))
+            return function(canvas, *tags)
+        return Counted
+
+    def CountSolve(self, function):
+        '''Solver.Solve counting the states expanded and the steps, through its progress callback'''
+        def Counted(solver, level, progress=None):
+            reached = [0, 1]
+            def Progress(depth, states):
+                reached[:] = depth, states
+                return progress is not None and progress(depth, states)
+            try:
+                return function(solver, level, Progress)
+            finally:
+                self.Count('solver_steps', reached[0])
+                self.Count('solver_states', reached[1])
+        return Counted
+
+    def Stats(self) -> dict:
+        '''Returns the spans and counters as a json ready dictionary'''
+        spans = {name: {'calls': calls, 'total': total, 'mean': total / calls, 'max': maximum}
+                 for name, (calls, total, maximum) in sorted(self.spans.items())}
+        return {'enabled': self.enabled, 'spans': spans, 'counters': dict(sorted(self.counters.items()))}
+
+    def Report(self) -> str:
+        '''Returns the stats as text lines, for the overlay'''
+        lines = ['%-30s %6d calls %8.3f ms mean %8.3f ms max' % (name, span['calls'], span['mean']*1000, span['max']*1000)
+                 for name, span in self.Stats()['spans'].items()]
+        lines += ['%-30s %10d' % (name, value) for name, value in sorted(self.counters.items())]
+        return '\n'.join(lines) or 'instrumentation enabled'
+
+    def Write(self, path):
+        '''Writes the stats as json, and the cProfile capture next to it as a .prof file readable by pstats'''
+        stats = self.Stats()
+        if self.profiler is not None:
+            stats['profile'] = os.path.splitext(path)[0] + '.prof'
+            self.profiler.dump_stats(stats['profile'])
+        with open(path, 'w') as f:
+            json.dump(stats, f, indent=1)
+
+
+################################################################################
+
+class CommandLine:
+    '''Headless entry point, used when main.py is started with a command'''
+    def __init__(self, argv):
+        '''Parses the arguments and runs the command'''
+        parser = argparse.ArgumentParser(prog='main.py', description='OverMove level tools')
+        parser.add_argument('--stats', default=None, help='write the instrumentation stats of the command to this json file, '
+                                                          'the worker processes are not measured so use --jobs 1 for complete stats')
+        parser.add_argument('--profile', action='store_true', help='with --stats, also capture a cProfile .prof file')
+        commands = parser.add_subparsers(dest='command', required=True)
+
+        analyse = commands.add_parser('analyse', help='print the difficulty report of every level as json lines')
+        analyse.add_argument('folder', nargs='?', default=os.path.join(os.getcwd(), 'Level_Folder'))
+        analyse.set_defaults(run=self.Analyse)
+
+        check = commands.add_parser('check', help='check that the Simulator, BatchVerifier, Solver and HintTable agree on every level, '
+                                                  'exits with status 1 otherwise')
+        check.add_argument('folder', nargs='?', default=os.path.join(os.getcwd(), 'Level_Folder'))
+        check.add_argument('--piles', type=int, default=2000, help='amount of random piles played on each level')
+        check.add_argument('--seed', type=int, default=0)
+        check.set_defaults(run=self.Check)
+
+        validate = commands.add_parser('validate', help='validate and solve every level of a folder on all cores, printing json lines')
+        validate.add_argument('folder', nargs='?', default=os.path.join(os.getcwd(), 'Level_Folder'))
+        validate.add_argument('--jobs', type=int, default=None, help='amount of worker processes, all the cores by default')
+        validate.add_argument('--cache', default=None, help='solution cache file read and filled by the solves')
+        validate.set_defaults(run=self.Validate)
+
+        pack = commands.add_parser('pack', help='write every level of a folder to a binary level pack')
+        pack.add_argument('pack', help='level pack file written')
+        pack.add_argument('folder', nargs='?', default=os.path.join(os.getcwd(), 'Level_Folder'))
+        pack.set_defaults(run=self.Pack)
+
+        unpack = commands.add_parser('unpack', help='write every level of a binary level pack back as json files')
+        unpack.add_argument('pack', help='level pack file read')
+        unpack.add_argument('folder', help='folder receiving the json files')
+        unpack.set_defaults(run=self.Unpack)
+
+        warm = commands.add_parser('warm', help='solve every level of a folder missing from the solution cache')
+        warm.add_argument('folder', nargs='?', default=os.path.join(os.getcwd(), 'Level_Folder'))
+        warm.add_argument('--cache', default=os.path.join(os.getcwd(), SolutionCache.FILE_NAME))
+        warm.add_argument('--max-entries', type=int, default=10000)
+        warm.add_argument('--jobs', type=int, default=None, help='amount of worker processes, all the cores by default')
+        warm.set_defaults(run=self.Warm)
+
+        replay = commands.add_parser('replay', help='play the attempt log again and print the failure heatmap of every level as json lines')
+        replay.add_argument('log', nargs='?', default=os.path.join(os.getcwd(), AttemptLog.FILE_NAME))
+        replay.add_argument('--folder', default=os.path.join(os.getcwd(), 'Level_Folder'))
+        replay.add_argument('--batch', type=int, default=65536, help='amount of attempts of a level evaluated together')
+        replay.set_defaults(run=self.Replay)
+
+        grade = commands.add_parser('grade', help='grade json lines of submitted moves from stdin or a socket, writing a verdict line for each')
+        grade.add_argument('--folder', default=os.path.join(os.getcwd(), 'Level_Folder'))
+        grade.add_argument('--socket', default=None, help='serve the clients of this unix socket path instead of stdin')
+        grade.add_argument('--port', type=int, default=None, help='serve the clients of this port of 127.0.0.1 instead of stdin')
+        grade.add_argument('--jobs', type=int, default=None, help='amount of worker processes, all the cores by default')
+        grade.add_argument('--chunk-size', type=int, default=Grader.CHUNK_SIZE, help='bytes of submissions graded together at most')
+        grade.set_defaults(run=self.Grade)
+
+        bench = commands.add_parser('bench', help='run the benchmark suite and write the results as json')
+        bench.add_argument('folder', nargs='?', default=os.path.join(os.getcwd(), 'Level_Folder'))
+        bench.add_argument('--output', default='bench_output.json')
+        bench.add_argument('--sizes', default='10x5,50x50', help='synthetic board sizes, as WIDTHxHEIGHT separated by commas')
+        bench.add_argument('--red-cells', default='8,64', help='synthetic red cell counts separated by commas')
+        bench.add_argument('--steps', default='15', help='synthetic step counts separated by commas')
+        bench.add_argument('--min-time', type=float, default=0.2)
+        bench.add_argument('--seed', type=int, default=0)
+        bench.set_defaults(run=self.Bench)
+
+        generate = commands.add_parser('generate', help='generate solvable levels as json files, verified on all cores')
+        generate.add_argument('folder', help='folder receiving the generated levels')
+        generate.add_argument('--count', type=int, default=100)
+        generate.add_argument('--prefix', default='Generated', help='name of the levels, followed by their number')
+        generate.add_argument('--red-cells', default='4-10', help='minimum and maximum amount of red cells, as MIN-MAX')
+        generate.add_argument('--min-length', type=int, default=10, help='minimal length of the shortest solution')
+        generate.add_argument('--min-solutions', type=int, default=1, help='minimal amount of distinct solutions')
+        generate.add_argument('--max-solutions', type=int, default=None, help='maximal amount of distinct solutions')
+        generate.add_argument('--seed', type=int, default=0)
+        generate.add_argument('--jobs', type=int, default=None, help='amount of worker processes, all the cores by default')
+        generate.set_defaults(run=self.Generate)
+
+        args = parser.parse_args(argv)
+        if args.stats is None:
+            args.run(args)
+            return
+
+        instruments = Instrumentation()
+        instruments.Enable(args.profile)
+        try:
+            args.run(args)
+        finally:
+            instruments.Disable()
+            instruments.Write(args.stats)
+
+    def Analyse(self, args):
+        repository = LevelRepository(args.folder)
+        for report in Analyser().Report(repository, Main.ListLevelFiles(args.folder)):
+            print(json.dumps(report), flush=True)
+
+    def Check(self, args):
+        failed = False
+        for report in RulesCheck(args.piles, args.seed).Report(LevelRepository(args.folder), Main.ListLevelFiles(args.folder)):
+            print(json.dumps(report), flush=True)
+            failed = failed or not report['ok']
+        if failed:
+            sys.exit(1)
+
+    def Validate(self, args):
+        pool = WorkerPool(args.jobs)
+        for result in pool.Map(functools.partial(Validator.Check, cache_path=args.cache), Validator.LevelPaths(args.folder)):
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+
+    def Pack(self, args):
+        LevelPack.FromFolder(args.folder, args.pack)
+        pack = LevelPack(args.pack)
+        print(json.dumps({'pack': args.pack, 'levels': len(pack), 'size': os.path.getsize(args.pack)}), flush=True)
+        pack.Close()
+
+    def Unpack(self, args):
+        os.makedirs(args.folder, exist_ok=True)
+        pack = LevelPack(args.pack)
+        try:
+            pack.ToFolder(args.folder)
+            print(json.dumps({'folder': args.folder, 'levels': len(pack)}), flush=True)
+        finally:
+            pack.Close()
+
+    def Warm(self, args):
+        cache = SolutionCache(args.cache, args.max_entries)
+        start = time.perf_counter()
+        report = cache.Warm(args.folder, args.jobs)
+        print(json.dumps(dict(report, entries=cache.Stats()['entries'], elapsed=time.perf_counter() - start)), flush=True)
+
+    def Replay(self, args):
+        for report in AttemptReplay(LevelRepository(args.folder), args.batch).Run(args.log):
+            print(json.dumps(report, ensure_ascii=False), flush=True)
+
+    def Grade(self, args):
+        grader = Grader(args.folder, args.jobs, args.chunk_size)
+        if args.socket is not None or args.port is not None:
+            grader.Listen(args.socket if args.socket is not None else args.port)
+        else:
+            grader.Serve(sys.stdin.buffer, sys.stdout.buffer)
+
+    def Bench(self, args):
+        benchmark = Benchmark(args.min_time, args.seed)
+        sizes = [tuple(int(value) for value in size.split('x')) for size in args.sizes.split(',')]
+        red_counts = [int(value) for value in args.red_cells.split(',')]
+        steps = [int(value) for value in args.steps.split(',')]
+
+        for result in benchmark.Run(args.folder, sizes, red_counts, steps):
+            print('%-20s %-36s %14.0f ops/s %10d bytes' % (result['benchmark'], result['level'],
+                                                            result['ops_per_sec'], result['peak_memory']), flush=True)
+
+        with open(args.output, 'w') as f:
+            json.dump(benchmark.Report(), f, indent=1)
+
+    def Generate(self, args):
+        minimum, maximum = (int(value) for value in args.red_cells.split('-'))
+        generator = LevelGenerator(red_cells=(minimum, maximum), min_length=args.min_length,
+                                   min_solutions=args.min_solutions, max_solutions=args.max_solutions)
+        os.makedirs(args.folder, exist_ok=True)
+
+        start = time.perf_counter()
+        for number, (seed, lv_data, solution, report) in enumerate(generator.Generate(args.count, args.seed, args.jobs), 1):
+            name = '%s %d' % (args.prefix, number)
+            with open(os.path.join(args.folder, name + '.json'), 'w', encoding='utf-8') as f:
+                json.dump(dict({'Identity': name}, **lv_data), f, ensure_ascii=False)
+            print(json.dumps({'level': name, 'seed': seed, 'solution': solution, 'shortest': report['shortest'],
+                              'solutions': sum(report['wins_at_step']), 'difficulty': report['difficulty'],
+                              'elapsed': time.perf_counter() - start}), flush=True)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        CommandLine(sys.argv[1:])
+    else:
+        Main()